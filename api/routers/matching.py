@@ -3,52 +3,80 @@ Matching API endpoints for the VoiceApp backend
 Handles voice-based matching, topic-based matching, and real-time match updates via WebSocket
 """
 
-import json
-import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 import asyncio
 import logging
+import time
+from functools import lru_cache
 
+import msgspec
 from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from infrastructure.container import container
 from infrastructure.middleware.firebase_auth_middleware import get_current_user
-from domain.entities import MatchStatus, User
+from infrastructure.websocket.payloads import Welcome, Authenticated, Pong, encode_payload, decode_inbound, iso_now
+from domain.entities import MatchStatus, User, new_match
 
 logger = logging.getLogger(__name__)
 
-# Dependency injection functions
+# Service singletons
+# The container is initialized in the app lifespan, after this module is
+# imported, so each service is resolved on first use (always from a handler,
+# once the lifespan has run) and memoized as a process-wide singleton.
+@lru_cache(maxsize=1)
 def get_websocket_manager():
     """Get WebSocket manager instance"""
     return container.get_websocket_manager()
 
+@lru_cache(maxsize=1)
 def get_matching_repository():
     """Get matching repository instance"""
     return container.get_matching_repository()
 
+@lru_cache(maxsize=1)
 def get_ai_host_service():
     """Get AI host service instance"""
     return container.get_ai_host_service()
 
+@lru_cache(maxsize=1)
 def get_openai_service():
     """Get OpenAI service instance"""
     return container.get_openai_service()
 
+@lru_cache(maxsize=1)
 def get_room_repository():
     """Get room repository instance"""
     return container.get_room_repository()
 
+@lru_cache(maxsize=1)
 def get_topic_repository():
     """Get topic repository instance"""
     return container.get_topic_repository()
 
+@lru_cache(maxsize=1)
+def get_user_repository():
+    """Get user repository instance"""
+    return container.get_user_repository()
+
+@lru_cache(maxsize=1)
 def get_event_broadcaster():
     """Get event broadcaster instance"""
     return container.get_event_broadcaster()
 
+# Queue size shared by every status poll; it only needs to be roughly current
+_QUEUE_SIZE_TTL_SECONDS = 0.5
+_queue_size_cache = {"value": 0, "expires_at": 0.0}
+
+# Time budgets (seconds) for backend calls on request paths; past these the
+# endpoint answers 503 so clients retry instead of piling up behind a slow backend
+CONFIRM_LOOKUP_TIMEOUT = 2.0
+HISTORY_TIMEOUT = 1.5
+TIMEOUT_PROCESS_TIMEOUT = 10.0
+
 router = APIRouter()
 
 # Request/Response Models
@@ -75,9 +103,9 @@ class AIMatchResponse(BaseModel):
     status: str
 
 class MatchResponse(BaseModel):
-    match_id: str
+    match_id: UUID
     room_id: str
-    participants: List[str]
+    participants: List[UUID]
     topic: str
     status: str
     estimated_wait_time: int
@@ -88,16 +116,21 @@ class QueueStatusResponse(BaseModel):
     queue_size: int
 
 # NEW: Match confirmation response model
+class MatchParticipant(BaseModel):
+    user_id: UUID
+    display_name: str
+    is_current_user: bool
+
 class MatchConfirmationResponse(BaseModel):
     match_id: str
     status: str
     is_ready: bool
-    room_id: Optional[str] = None
+    room_id: Optional[UUID] = None
     room_name: Optional[str] = None
     livekit_room_name: Optional[str] = None
     livekit_token: Optional[str] = None
     topic: Optional[str] = None
-    participants: Optional[List[dict]] = None
+    participants: Optional[List[MatchParticipant]] = None
     match_confidence: Optional[float] = None
     created_at: Optional[str] = None
     matched_at: Optional[str] = None
@@ -105,34 +138,63 @@ class MatchConfirmationResponse(BaseModel):
     estimated_wait_time: Optional[int] = None
 
 # Helper functions
-def get_topic_name_for_match(match, topic_repo) -> str:
-    """Get topic name for a match, fallback to 'General' if not found"""
+def get_match_topic_id(match) -> Optional[UUID]:
+    """Get the topic ID a match is filed under (its first preferred topic)"""
+    if not match.preferred_topics:
+        return None
+    
+    topic_id = match.preferred_topics[0]
+    if isinstance(topic_id, UUID):
+        return topic_id
+    
     try:
-        # Try to get topic from the first preferred topic if available
-        # This is simplified - in production you might store the actual matched topic
-        if hasattr(match, 'preferred_topics') and match.preferred_topics:
-            topic_id = UUID(match.preferred_topics[0])
-            topic = topic_repo.find_by_id(topic_id)
-            return topic.name if topic else "General"
-        return "General"
-    except:
-        return "General"
+        return UUID(str(topic_id))
+    except ValueError:
+        return None
+
+def get_topic_name_for_match(match, topic_names: Dict[UUID, str]) -> str:
+    """Get topic name for a match from prefetched names, fallback to 'General' if not found"""
+    # This is simplified - in production you might store the actual matched topic
+    return topic_names.get(get_match_topic_id(match), "General")
+
+def get_cached_queue_size() -> int:
+    """Get the matching queue size, re-read from Redis at most every _QUEUE_SIZE_TTL_SECONDS"""
+    now = time.monotonic()
+    if now >= _queue_size_cache["expires_at"]:
+        _queue_size_cache["value"] = get_matching_repository().get_queue_size()
+        _queue_size_cache["expires_at"] = now + _QUEUE_SIZE_TTL_SECONDS
+    return _queue_size_cache["value"]
+
+async def _with_timeout(awaitable, timeout: float, operation: str):
+    """Await a backend call, failing fast with 503 if it exceeds its time budget"""
+    try:
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"⏱️ {operation} timed out after {timeout}s")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{operation} timed out, please retry"
+        )
+
+async def _no_result():
+    """Stand-in for an optional lookup that has nothing to fetch"""
+    return None
 
 # Matching endpoints
-@router.post("/match", response_model=MatchResponse)
+@router.post("/match", response_model=MatchResponse, response_class=ORJSONResponse)
 async def request_match(
     request: MatchRequest,
-    matching_repo = Depends(get_matching_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Request to be matched with other users
     """
+    matching_repo = get_matching_repository()
+    
     try:
         current_user_id = current_user.id
         
         # Create a match record
-        from domain.entities import new_match
         match = new_match(
             user_id=current_user_id,
             preferred_topics=request.preferred_topics,
@@ -151,11 +213,11 @@ async def request_match(
         saved_match = matching_repo.save_match(match)
         
         return MatchResponse(
-            match_id=str(saved_match.id),
+            match_id=saved_match.id,
             room_id=str(saved_match.room_id) if saved_match.room_id else "",
-            participants=[str(saved_match.user_id)] + [str(u) for u in saved_match.matched_users],
+            participants=[saved_match.user_id, *saved_match.matched_users],
             topic=request.preferred_topics[0] if request.preferred_topics else "General",
-            status=saved_match.status.name.lower(),
+            status=saved_match.status_str,
             estimated_wait_time=30  # Mock estimate
         )
     except Exception as e:
@@ -166,12 +228,13 @@ async def request_match(
 
 @router.post("/cancel")
 async def cancel_match(
-    matching_repo = Depends(get_matching_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Cancel pending match request
     """
+    matching_repo = get_matching_repository()
+    
     try:
         current_user_id = current_user.id
         
@@ -187,18 +250,22 @@ async def cancel_match(
 
 @router.get("/status", response_model=QueueStatusResponse)
 async def get_queue_status(
-    matching_repo = Depends(get_matching_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get current position in matching queue
+    
+    Clients connected to /ws receive queue_update messages whenever their
+    position changes; this endpoint is the fallback for clients without one.
     """
+    matching_repo = get_matching_repository()
+    
     try:
         current_user_id = current_user.id
         
         # Get queue information from repository
         position = matching_repo.get_queue_position(current_user_id)
-        queue_size = matching_repo.get_queue_size()
+        queue_size = get_cached_queue_size()
         
         return QueueStatusResponse(
             position=position,
@@ -211,39 +278,75 @@ async def get_queue_status(
             detail=str(e)
         )
 
-@router.get("/history")
+@router.get("/history", response_class=ORJSONResponse)
 async def get_match_history(
-    limit: int = 20, 
-    offset: int = 0,
-    matching_repo = Depends(get_matching_repository),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get user's match history
+    Get user's match history, one page at a time (newest first)
+    
+    Pass the previous page's next_cursor as cursor to fetch the following page;
+    offset is kept for older clients.
     """
+    matching_repo = get_matching_repository()
+    
+    # The cursor is "<created_at>|<match_id>"; the ID breaks ties between
+    # matches created at the same instant
+    history_cursor = None
+    if cursor:
+        try:
+            created_at, match_id = cursor.split("|")
+            datetime.fromisoformat(created_at)
+            history_cursor = (created_at, str(UUID(match_id)))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
     try:
         current_user_id = current_user.id
         
         # Get matches from repository
-        matches = matching_repo.find_matches_by_user_id(current_user_id, limit=limit)
+        matches = await _with_timeout(
+            asyncio.to_thread(
+                matching_repo.find_matches_by_user_id, current_user_id,
+                limit=limit, offset=0 if history_cursor else offset, cursor=history_cursor
+            ),
+            HISTORY_TIMEOUT,
+            "Match history lookup"
+        )
         
-        # Get topic repository for name lookup
-        topic_repo = container.get_topic_repository()
+        # Resolve every distinct topic name with one batched read
+        topic_ids = {get_match_topic_id(match) for match in matches}
+        topic_ids.discard(None)
+        topics = await _with_timeout(
+            asyncio.to_thread(get_topic_repository().find_by_ids, list(topic_ids)),
+            HISTORY_TIMEOUT,
+            "Match history topic lookup"
+        ) if topic_ids else {}
+        topic_names = {topic_id: topic.name for topic_id, topic in topics.items()}
         
         match_history = []
         for match in matches:
             match_history.append({
-                "match_id": str(match.id),
-                "topic": get_topic_name_for_match(match, topic_repo),
-                "participants": [str(match.user_id)] + [str(u) for u in match.matched_users],
+                "match_id": match.id,
+                "topic": get_topic_name_for_match(match, topic_names),
+                "participants": [match.user_id, *match.matched_users],
                 "created_at": match.created_at.isoformat(),
-                "status": match.status.name.lower()
+                "status": match.status_str
             })
         
         return {
             "matches": match_history,
-            "total": len(match_history)
+            "total": len(match_history),
+            "next_cursor": f"{matches[-1].created_at.isoformat()}|{matches[-1].id}" if len(matches) == limit else None
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -253,12 +356,13 @@ async def get_match_history(
 @router.post("/process-timeout-matches")
 async def process_timeout_matches_manually(
     timeout_minutes: float = 1.0,
-    matching_repo = Depends(get_matching_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Manually trigger timeout matching process (for testing/admin use)
     """
+    matching_repo = get_matching_repository()
+    
     try:
         # Check current timeout users count
         timeout_users_count = matching_repo.get_timeout_users_count(timeout_minutes)
@@ -270,8 +374,13 @@ async def process_timeout_matches_manually(
                 "matches_created": []
             }
         
-        # Process timeout matches
-        matches_created = matching_repo.process_timeout_matches(timeout_minutes)
+        # Process timeout matches; shielded so rooms already being set up are
+        # finished rather than abandoned half-built if the request gives up waiting
+        matches_created = await _with_timeout(
+            asyncio.shield(matching_repo.process_timeout_matches(timeout_minutes)),
+            TIMEOUT_PROCESS_TIMEOUT,
+            "Timeout match processing"
+        )
         
         return {
             "message": f"Processed timeout matching for {timeout_users_count} users waiting over {timeout_minutes} minute(s)",
@@ -280,6 +389,8 @@ async def process_timeout_matches_manually(
             "matches": matches_created
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -289,12 +400,13 @@ async def process_timeout_matches_manually(
 @router.get("/timeout-stats") 
 async def get_timeout_stats(
     timeout_minutes: float = 1.0,
-    matching_repo = Depends(get_matching_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get statistics about users waiting too long
     """
+    matching_repo = get_matching_repository()
+    
     try:
         timeout_users_count = matching_repo.get_timeout_users_count(timeout_minutes)
         total_queue_size = matching_repo.get_queue_size()
@@ -314,12 +426,9 @@ async def get_timeout_stats(
         )
 
 # NEW: AI-Driven Matching Endpoint with GPT-4o Audio
-@router.post("/ai-match", response_model=AIMatchResponse)
+@router.post("/ai-match", response_model=AIMatchResponse, response_class=ORJSONResponse)
 async def ai_driven_match(
     request: AIMatchRequest,
-    matching_repo = Depends(get_matching_repository),
-    ai_host_service = Depends(get_ai_host_service),
-    openai_service = Depends(get_openai_service),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -333,6 +442,9 @@ async def ai_driven_match(
     3. Match users based on hashtag similarity
     4. Return match results and AI voice confirmation
     """
+    matching_repo = get_matching_repository()
+    openai_service = get_openai_service()
+    
     try:
         current_user_id = current_user.id
         
@@ -364,7 +476,7 @@ async def ai_driven_match(
         # Step 2: Always add user to queue first (let background matcher handle matching)
         logger.info("🔍 Adding user to AI matching queue...")
         
-        ai_session_id = f"ai_waiting_{str(current_user_id)}_{datetime.utcnow().timestamp()}"
+        ai_session_id = f"ai_waiting_{uuid4().hex}"
         
         matching_repo.add_to_ai_queue(
             user_id=str(current_user_id),
@@ -379,7 +491,7 @@ async def ai_driven_match(
         match_confidence = 0.0  # Will be determined by background matcher
         
         # Step 4: Generate a unique match ID
-        match_id = f"ai_match_{str(current_user_id)}_{datetime.utcnow().timestamp()}"
+        match_id = f"ai_match_{uuid4().hex}"
         
         # Build the response - always waiting status
         response = AIMatchResponse(
@@ -412,11 +524,9 @@ async def ai_driven_match(
             detail=f"AI matching service error: {str(e)}"
         )
 
-@router.get("/confirm/{match_id}", response_model=MatchConfirmationResponse)
+@router.get("/confirm/{match_id}", response_model=MatchConfirmationResponse, response_class=ORJSONResponse)
 async def confirm_match(
     match_id: str,
-    matching_repo = Depends(get_matching_repository),
-    room_repo = Depends(get_room_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -428,6 +538,9 @@ async def confirm_match(
     3. Get participant information
     4. Navigate to the conversation room
     """
+    matching_repo = get_matching_repository()
+    room_repo = get_room_repository()
+    
     try:
         current_user_id = current_user.id
         
@@ -449,18 +562,32 @@ async def confirm_match(
             )
         
         # Check match status
-        if match.status.name.lower() != "matched":
+        status_str = match.status_str
+        if status_str != "matched":
             return MatchConfirmationResponse(
                 match_id=match_id,
-                status=match.status.name.lower(),
+                status=status_str,
                 is_ready=False,
-                message=f"Match is not ready yet. Current status: {match.status.name.lower()}",
-                estimated_wait_time=match.estimated_wait_time if hasattr(match, 'estimated_wait_time') else 30
+                message=f"Match is not ready yet. Current status: {status_str}",
+                estimated_wait_time=match.estimated_wait_time
             )
         
         # Get room details if match is successful
         if match.room_id:
-            room = room_repo.find_by_id(match.room_id)
+            all_participant_ids = [match.user_id, *match.matched_users]
+            
+            # Room, participants and topic are independent reads - fetch them concurrently
+            topic_repo = get_topic_repository()
+            room, users, topic = await _with_timeout(
+                asyncio.gather(
+                    asyncio.to_thread(room_repo.find_by_id, match.room_id),
+                    asyncio.to_thread(get_user_repository().find_by_ids, all_participant_ids),
+                    asyncio.to_thread(topic_repo.find_by_id, match.selected_topic_id) if match.selected_topic_id else _no_result()
+                ),
+                CONFIRM_LOOKUP_TIMEOUT,
+                "Match room lookup"
+            )
+            
             if not room:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -470,27 +597,18 @@ async def confirm_match(
             # Generate LiveKit token for the user
             livekit_token = room_repo.generate_livekit_token(match.room_id, current_user_id)
             
-            # Get participant details
-            user_repo = container.get_user_repository()
-            participants = []
-            all_participant_ids = [match.user_id] + match.matched_users
-            
-            for participant_id in all_participant_ids:
-                user = user_repo.find_by_id(participant_id)
-                if user:
-                    participants.append({
-                        "user_id": str(participant_id),
-                        "display_name": user.display_name,
-                        "is_current_user": participant_id == current_user_id
-                    })
+            # Get participant details, keeping the match's participant order
+            participants = [
+                MatchParticipant(
+                    user_id=participant_id,
+                    display_name=users[participant_id].display_name,
+                    is_current_user=participant_id == current_user_id
+                )
+                for participant_id in all_participant_ids
+                if participant_id in users
+            ]
             
-            # Get topic information
-            topic_repo = container.get_topic_repository()
-            topic_name = "General Chat"
-            if match.selected_topic_id:
-                topic = topic_repo.find_by_id(match.selected_topic_id)
-                if topic:
-                    topic_name = topic.name
+            topic_name = topic.name if topic else "General Chat"
             
             logger.info(f"✅ Match confirmed successfully: {match_id}")
             
@@ -498,13 +616,13 @@ async def confirm_match(
                 match_id=match_id,
                 status="matched",
                 is_ready=True,
-                room_id=str(match.room_id),
+                room_id=match.room_id,
                 room_name=room.name,
                 livekit_room_name=room.livekit_room_name,
                 livekit_token=livekit_token,
                 topic=topic_name,
                 participants=participants,
-                match_confidence=getattr(match, 'confidence', 1.0),
+                match_confidence=match.confidence,
                 created_at=match.created_at.isoformat(),
                 matched_at=match.matched_at.isoformat() if match.matched_at else None,
                 message="Match confirmed! Ready to join conversation."
@@ -529,6 +647,24 @@ async def confirm_match(
             detail=f"Failed to confirm match: {str(e)}"
         )
 
+async def _validate_ws_query(websocket: WebSocket) -> Optional[UUID]:
+    """
+    Get the user_id query parameter of a WebSocket handshake
+    
+    Invalid handshakes are closed before accept(), which the server answers with
+    an HTTP 403 instead of completing the upgrade. Returns None in that case.
+    """
+    user_id_param = websocket.query_params.get("user_id")
+    if not user_id_param:
+        await websocket.close(code=1008, reason="user_id query parameter required")
+        return None
+    
+    try:
+        return UUID(user_id_param)
+    except ValueError:
+        await websocket.close(code=1008, reason="Invalid user_id format. Must be a valid UUID")
+        return None
+
 # WebSocket endpoint for real-time matching updates
 @router.websocket("/ws")
 async def websocket_matching(websocket: WebSocket):
@@ -538,29 +674,9 @@ async def websocket_matching(websocket: WebSocket):
     websocket_manager = get_websocket_manager()
     
     try:
-        # Get user_id from query parameters if available
-        user_id_param = websocket.query_params.get("user_id")
-        
-        # Reduced logging - only log when user_id is provided
-        if not user_id_param:
-            # Accept and close quietly for invalid connections
-            await websocket.accept()
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": f"user_id query parameter required (e.g., ws://{os.getenv('RAILWAY_PUBLIC_DOMAIN', 'localhost:8000')}/api/matching/ws?user_id=your-uuid)"
-            }))
-            await websocket.close(code=1008)
-            return
-        
-        try:
-            user_id = UUID(user_id_param)
-        except ValueError:
-            await websocket.accept()
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": "Invalid user_id format. Must be a valid UUID"
-            }))
-            await websocket.close(code=1008)
+        # Reject bad handshakes quietly, before accepting the connection
+        user_id = await _validate_ws_query(websocket)
+        if user_id is None:
             return
         
         # Only log successful connections
@@ -570,31 +686,27 @@ async def websocket_matching(websocket: WebSocket):
         connection_id = await websocket_manager.connect(websocket, user_id, "matching")
         
         # Send welcome message immediately
-        welcome_message = {
-            "type": "welcome",
-            "message": "Connected to matching service",
-            "user_id": str(user_id),
-            "connection_id": connection_id,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        welcome_message = Welcome(
+            message="Connected to matching service",
+            user_id=str(user_id),
+            connection_id=connection_id,
+            timestamp=iso_now()
+        )
         
-        await websocket.send_text(json.dumps(welcome_message))
+        await websocket.send_bytes(encode_payload(welcome_message))
         
         # Main message handling loop
         try:
             # Main message handling loop with improved error handling
+            # The server also pings with WebSocket control frames (uvicorn
+            # --ws-ping-interval); the JSON ping is answered for documented clients
             async for message in websocket.iter_text():
                 try:
-                    data = json.loads(message)
-                    message_type = data.get("type", "unknown")
+                    message_type = decode_inbound(message).type
                     
                     if message_type == "ping":
                         # Client heartbeat - respond with pong
-                        pong_message = {
-                            "type": "pong",
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                        await websocket.send_text(json.dumps(pong_message))
+                        await websocket.send_bytes(encode_payload(Pong(timestamp=iso_now())))
                     
                     elif message_type == "pong":
                         # Client responded to our ping - update last activity
@@ -602,19 +714,18 @@ async def websocket_matching(websocket: WebSocket):
                     
                     elif message_type == "auth":
                         # Authentication (if needed)
-                        auth_response = {
-                            "type": "authenticated",
-                            "user_id": str(user_id),
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                        await websocket.send_text(json.dumps(auth_response))
+                        auth_response = Authenticated(
+                            user_id=str(user_id),
+                            timestamp=iso_now()
+                        )
+                        await websocket.send_bytes(encode_payload(auth_response))
                         logger.debug(f"🔐 [MATCHING_WS] Auth confirmed: {user_id}")
                     
                     else:
                         # Log unknown messages for debugging
-                        logger.debug(f"❓ [MATCHING_WS] Unknown message from {user_id}: {message_type} - {data}")
+                        logger.debug(f"❓ [MATCHING_WS] Unknown message from {user_id}: {message_type} - {message}")
                         
-                except json.JSONDecodeError:
+                except msgspec.DecodeError:
                     logger.warning(f"⚠️ [MATCHING_WS] Invalid JSON from {user_id}: {message}")
                 except Exception as e:
                     logger.error(f"❌ [MATCHING_WS] Message processing error from {user_id}: {e}")
@@ -651,47 +762,21 @@ async def websocket_general(websocket: WebSocket):
     
     try:
         # Get user_id from query parameters
-        user_id_param = websocket.query_params.get("user_id")
-        
-        if not user_id_param:
-            await websocket.accept()
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": f"user_id query parameter required (e.g., ws://{os.getenv('RAILWAY_PUBLIC_DOMAIN', 'localhost:8000')}/api/matching/ws/general?user_id=your-uuid)"
-            }))
-            await websocket.close(code=1008)
-            return
-        
-        try:
-            user_id = UUID(user_id_param)
-        except ValueError:
-            await websocket.accept()
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": "Invalid user_id format. Must be a valid UUID"
-            }))
-            await websocket.close(code=1008)
+        user_id = await _validate_ws_query(websocket)
+        if user_id is None:
             return
         
         # Register connection (this will accept the connection)
         connection_id = await websocket_manager.connect(websocket, user_id, "general")
         
-        # Keep connection alive
+        # Keep connection alive - the only inbound message is the client's JSON
+        # ping; the server also pings with WebSocket control frames
         async for message in websocket.iter_text():
             try:
-                msg_data = json.loads(message)
-                
-                if msg_data.get("type") == "ping":
-                    await websocket.send_text(json.dumps({
-                        "type": "pong", 
-                        "timestamp": datetime.utcnow().isoformat()
-                    }))
-                    
-            except json.JSONDecodeError:
+                if decode_inbound(message).type == "ping":
+                    await websocket.send_bytes(encode_payload(Pong(timestamp=iso_now())))
+            except msgspec.DecodeError:
                 logger.warning(f"Invalid JSON received: {message}")
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
-                break
                 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected for general")
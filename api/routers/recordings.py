@@ -2,22 +2,67 @@
 Recordings API routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Request, Response, status
+from fastapi.responses import ORJSONResponse, RedirectResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
-import io
+from datetime import datetime
+from functools import lru_cache
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import re
+import tempfile
+import time
 
+import numpy as np
+import orjson
+from google.cloud.firestore import SERVER_TIMESTAMP
+
+from infrastructure.config import settings
 from infrastructure.container import container
 from infrastructure.middleware.firebase_auth_middleware import get_current_user
 from domain.entities import RecordingStatus, User
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# orjson encodes the large transcript/summary payloads faster and handles datetimes natively
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Public base URL for share links, resolved once from the deployment domain
+_PUBLIC_DOMAIN = os.getenv('RAILWAY_PUBLIC_DOMAIN', 'localhost:8000')
+_SHARE_BASE_URL = f"{'https' if 'railway.app' in _PUBLIC_DOMAIN else 'http'}://{_PUBLIC_DOMAIN}"
+
+# Polling clients may reuse a GET response for this long before revalidating
+_CACHE_CONTROL = "private, max-age=30"
+
+# Recording audio is spooled to disk past this size and streamed in chunks of it
+_AUDIO_CHUNK_SIZE = 1 << 20
+
+# Recording files proxied from Storage are read and sent in blocks of this size
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Word endings that close a transcript segment
+_END_PUNCT = frozenset(".!?")
+
+# Recording listings are cached briefly in Redis; writes bump the namespace
+# version so cached listings are dropped at once
+_RECORDINGS_CACHE_NAMESPACE = "recordings"
+_LIST_CACHE_TTL = 30
+
+# Summary single-flight: results are cached per transcript version; the
+# generation lock bounds how long concurrent requests wait on one another
+_SUMMARY_CACHE_TTL = 3600
+_SUMMARY_LOCK_TTL = 60
+_SUMMARY_POLL_INTERVAL = 0.2
 
 # Request/Response Models
 class RecordingResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     room_id: str
     room_name: str
@@ -30,6 +75,8 @@ class RecordingResponse(BaseModel):
     download_url: Optional[str] = None
 
 class RecordingListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     recordings: List[RecordingResponse]
     total: int
 
@@ -39,14 +86,81 @@ class RecordingMetadata(BaseModel):
     tags: List[str] = []
     is_public: bool = False
 
-# Dependency injection
-def get_recording_repository():
+# Fields the recording detail response and its access check read; leaves the
+# potentially large transcript_data and metadata in Firestore
+_RECORDING_DETAIL_FIELDS = (
+    "id", "room_id", "room_name", "topic", "participants", "duration", "file_size",
+    "created_at", "status", "download_url", "creator_id"
+)
+
+# Canonical UUID text form, checked before any other dependency runs
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
+async def valid_recording_id(recording_id: str = Path(description="Recording ID")) -> UUID:
+    """
+    Parse the recording ID path parameter
+    
+    Declared first on every recording route, so a malformed ID is rejected
+    before authentication or any repository call is made.
+    """
+    if not _UUID_RE.fullmatch(recording_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid recording ID format"
+        )
+    return UUID(recording_id)
+
+RecordingId = Annotated[UUID, Depends(valid_recording_id)]
+
+# Dependency injection (async so FastAPI resolves it on the event loop, not the thread pool)
+async def get_recording_repository():
     return container.get_recording_repository()
 
+# Only called from handlers (i.e. once the lifespan has initialized the
+# container), so the service can be memoized as a process-wide singleton.
+@lru_cache(maxsize=1)
+def get_openai_service():
+    """Get OpenAI service instance"""
+    return container.get_openai_service()
+
+@lru_cache(maxsize=1)
+def get_redis_service():
+    """Get Redis service instance"""
+    return container.get_redis_service()
+
+def _weak_etag(*parts) -> str:
+    """Build a weak ETag from the values a response body is derived from"""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+def _transcript_digest(transcript_entries) -> str:
+    """Stable digest of transcript entries, used to version transcript and summary responses"""
+    transcript_json = json.dumps(transcript_entries, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(transcript_json, digest_size=8).hexdigest()
+
+def _not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Tag a GET response and short-circuit it when the client already has it
+    
+    Returns a bodyless 304 response if If-None-Match matches the ETag,
+    otherwise sets the caching headers on the outgoing response and returns None.
+    """
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+        )
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return None
+
 # Recordings endpoints
 @router.get("/", response_model=RecordingListResponse)
 async def get_recordings(
-    room_id: Optional[str] = None,
+    request: Request,
+    response: Response,
+    room_id: Optional[UUID] = None,
     topic: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
@@ -59,33 +173,63 @@ async def get_recordings(
     try:
         current_user_id = current_user.id
         
+        # Read-through cache of the serialized listing, stored as "<etag>\n<body>"
+        redis_service = get_redis_service()
+        cache_version = await redis_service.get_cache_version(_RECORDINGS_CACHE_NAMESPACE)
+        cache_key = f"recordings:list:{cache_version}:{current_user_id}:{room_id}:{topic}:{limit}:{offset}"
+        cached = await redis_service.get_cached_response(cache_key)
+        if cached:
+            etag, _, body = cached.partition("\n")
+            not_modified = _not_modified(request, response, etag)
+            if not_modified:
+                return not_modified
+            return Response(content=body, media_type="application/json", headers=dict(response.headers))
+        
         # Get recordings from repository
+        # Filtering, ordering and paging all happen in the Firestore query
+        # total is the size of the whole listing (a COUNT aggregation), not of this page;
+        # it is stored with the page in the listing cache, so it runs once per cache fill
         if room_id:
-            recordings = recording_repo.find_by_room_id(UUID(room_id), limit=limit)
+            recordings = recording_repo.find_by_room_id(room_id, limit=limit, offset=offset)
+            total = recording_repo.count_by_room_id(room_id)
         elif topic:
-            recordings = recording_repo.find_by_topic(topic, limit=limit)
+            recordings = recording_repo.find_by_topic(topic, limit=limit, offset=offset)
+            total = recording_repo.count_by_topic(topic)
         else:
-            recordings = recording_repo.find_by_user_id(current_user_id, limit=limit)
-        
-        recording_responses = []
-        for recording in recordings:
-            recording_responses.append(RecordingResponse(
-                id=str(recording.id),
-                room_id=str(recording.room_id),
-                room_name=recording.room_name,
-                topic=recording.topic,
-                participants=[str(p) for p in recording.participants],
-                duration=recording.duration,
-                file_size=recording.file_size,
-                created_at=recording.created_at.isoformat(),
-                status=recording.status.name.lower(),
-                download_url=recording.download_url
-            ))
-        
-        return RecordingListResponse(
-            recordings=recording_responses,
-            total=len(recording_responses)
-        )
+            recordings = recording_repo.find_by_user_id(current_user_id, limit=limit, offset=offset)
+            total = recording_repo.count_by_user_id(current_user_id)
+        
+        # Skip building the response models when the listing is unchanged
+        etag = _weak_etag(total, *(
+            (recording.id, recording.status.name, recording.processed_at, recording.download_url)
+            for recording in recordings
+        ))
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+        
+        # Values come straight from trusted entities, so serialize plain dicts
+        # in the RecordingListResponse shape instead of building models per row
+        recording_rows = [
+            {
+                "id": recording.id_str,
+                "room_id": recording.room_id_str,
+                "room_name": recording.room_name,
+                "topic": recording.topic,
+                "participants": recording.participant_ids,
+                "duration": recording.duration,
+                "file_size": recording.file_size,
+                "created_at": recording.created_at_iso,
+                "status": recording.status_str,
+                "download_url": recording.download_url
+            }
+            for recording in recordings
+        ]
+        
+        body = orjson.dumps({"recordings": recording_rows, "total": total}).decode()
+        await redis_service.cache_response(cache_key, f"{etag}\n{body}", _LIST_CACHE_TTL)
+        
+        return Response(content=body, media_type="application/json", headers=dict(response.headers))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -94,7 +238,9 @@ async def get_recordings(
 
 @router.get("/{recording_id}", response_model=RecordingResponse)
 async def get_recording(
-    recording_id: str,
+    recording_id: RecordingId,
+    request: Request,
+    response: Response,
     recording_repo = Depends(get_recording_repository),
     current_user: User = Depends(get_current_user)
 ):
@@ -102,10 +248,8 @@ async def get_recording(
     Get specific recording details
     """
     try:
-        recording_uuid = UUID(recording_id)
-        
         # Get recording from repository
-        recording = recording_repo.find_by_id(recording_uuid)
+        recording = recording_repo.find_by_id(recording_id, fields=_RECORDING_DETAIL_FIELDS)
         if not recording:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -116,7 +260,7 @@ async def get_recording(
         has_access = False
         
         # Creator always has access
-        if recording.created_by == current_user.id:
+        if recording.creator_id == current_user.id:
             has_access = True
         # Check if user was a participant in the recording
         elif hasattr(recording, 'participants') and recording.participants:
@@ -135,32 +279,55 @@ async def get_recording(
                 detail="Access denied - you can only access recordings you created or participated in"
             )
         
-        return RecordingResponse(
-            id=str(recording.id),
-            room_id=str(recording.room_id),
-            room_name=recording.room_name or f"Room {recording.room_id}",
+        recording_response = RecordingResponse(
+            id=recording.id_str,
+            room_id=recording.room_id_str,
+            room_name=recording.room_name or f"Room {recording.room_id_str}",
             topic="General",  # Could be enhanced with topic lookup
-            participants=[str(p) for p in recording.participants] if recording.participants else [],
+            participants=recording.participant_ids,
             duration=recording.duration or 0,
             file_size=recording.file_size or 0,
-            created_at=recording.created_at.isoformat(),
-            status=recording.status.name.lower(),
+            created_at=recording.created_at_iso,
+            status=recording.status_str,
             download_url=recording.download_url
         )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid recording ID format"
-        )
+        
+        # Tag the response fields themselves, so any change to the body changes the tag
+        etag = _weak_etag(*recording_response.model_dump().values())
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+        
+        return recording_response
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Recording not found"
         )
 
+async def _iter_recording_file(recording_repo, file_path: str):
+    """
+    Stream a recording file from Storage, fetching the next block while the
+    current one is being sent
+    """
+    reader = await asyncio.to_thread(recording_repo.open_file, file_path, _DOWNLOAD_CHUNK_SIZE)
+    pending = asyncio.ensure_future(asyncio.to_thread(reader.read, _DOWNLOAD_CHUNK_SIZE))
+    try:
+        while True:
+            chunk = await pending
+            if not chunk:
+                break
+            pending = asyncio.ensure_future(asyncio.to_thread(reader.read, _DOWNLOAD_CHUNK_SIZE))
+            yield chunk
+    finally:
+        # A read cannot be interrupted mid-thread; let it finish before closing
+        if not pending.done():
+            await asyncio.wait([pending])
+        await asyncio.to_thread(reader.close)
+
 @router.get("/{recording_id}/download")
 async def download_recording(
-    recording_id: str,
+    recording_id: RecordingId,
     recording_repo = Depends(get_recording_repository),
     current_user: User = Depends(get_current_user)
 ):
@@ -168,10 +335,8 @@ async def download_recording(
     Download recording file
     """
     try:
-        recording_uuid = UUID(recording_id)
-        
-        # Get recording from repository
-        recording = recording_repo.find_by_id(recording_uuid)
+        # Get only the download fields of the recording
+        recording = recording_repo.find_download_info(recording_id)
         if not recording:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -179,28 +344,39 @@ async def download_recording(
             )
         
         # Check if recording is ready for download
-        if recording.status != RecordingStatus.READY:
+        if recording["status"] != RecordingStatus.READY:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Recording is not ready for download"
             )
         
-        # For now, return a redirect to the download URL or placeholder
-        if recording.download_url:
-            from fastapi.responses import RedirectResponse
-            return RedirectResponse(url=recording.download_url)
-        else:
-            # Placeholder response - in production would stream from Firebase Storage
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Download URL not available"
+        # Behind nginx, let the proxy stream the file from its internal location:
+        # the worker is released at once and the storage URL never reaches the client
+        if settings.RECORDING_ACCEL_REDIRECT_PREFIX:
+            file_name = os.path.basename(recording["file_path"] or "") or f"recording_{recording_id}.wav"
+            return Response(
+                status_code=status.HTTP_200_OK,
+                headers={
+                    "X-Accel-Redirect": f"{settings.RECORDING_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{recording_id}",
+                    "Content-Disposition": f'attachment; filename="{file_name}"'
+                }
+            )
+        
+        # Otherwise redirect to the download URL, or stream the file from Storage
+        if recording["download_url"]:
+            return RedirectResponse(url=recording["download_url"])
+        if recording["file_path"]:
+            file_name = os.path.basename(recording["file_path"]) or f"recording_{recording_id}.wav"
+            return StreamingResponse(
+                _iter_recording_file(recording_repo, recording["file_path"]),
+                media_type="audio/wav",
+                headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
             )
-            
-    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid recording ID format"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Download URL not available"
         )
+            
     except HTTPException:
         raise
     except Exception as e:
@@ -211,7 +387,7 @@ async def download_recording(
 
 @router.post("/{recording_id}/metadata")
 async def update_recording_metadata(
-    recording_id: str,
+    recording_id: RecordingId,
     metadata: RecordingMetadata,
     recording_repo = Depends(get_recording_repository),
     current_user: User = Depends(get_current_user)
@@ -220,28 +396,27 @@ async def update_recording_metadata(
     Update recording metadata
     """
     try:
-        recording_uuid = UUID(recording_id)
-        
-        # Check if recording exists
-        recording = recording_repo.find_by_id(recording_uuid)
-        if not recording:
+        # Check if recording exists (reads only its stored metadata)
+        stored_metadata = recording_repo.find_metadata(recording_id)
+        if stored_metadata is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording not found"
             )
         
-        # Prepare metadata dictionary
+        # Only write the fields that actually differ from what is stored
         metadata_dict = {
-            "title": metadata.title,
-            "description": metadata.description,
-            "tags": metadata.tags,
-            "is_public": metadata.is_public,
-            "updated_by": str(current_user.id),
-            "updated_at": recording_repo.firebase.get_server_timestamp()
+            key: value for key, value in metadata.model_dump().items()
+            if stored_metadata.get(key) != value
         }
+        if not metadata_dict:
+            return {"message": "Recording metadata unchanged"}
+        
+        metadata_dict["updated_by"] = str(current_user.id)
+        metadata_dict["updated_at"] = SERVER_TIMESTAMP
         
         # Update metadata using repository
-        success = recording_repo.update_recording_metadata(recording_uuid, metadata_dict)
+        success = recording_repo.update_recording_metadata(recording_id, metadata_dict)
         
         if not success:
             raise HTTPException(
@@ -249,12 +424,9 @@ async def update_recording_metadata(
                 detail="Failed to update recording metadata"
             )
         
+        await get_redis_service().bump_cache_version(_RECORDINGS_CACHE_NAMESPACE)
+        
         return {"message": "Recording metadata updated successfully"}
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid recording ID format"
-        )
     except HTTPException:
         raise
     except Exception as e:
@@ -265,7 +437,7 @@ async def update_recording_metadata(
 
 @router.delete("/{recording_id}")
 async def delete_recording(
-    recording_id: str,
+    recording_id: RecordingId,
     recording_repo = Depends(get_recording_repository),
     current_user: User = Depends(get_current_user)
 ):
@@ -273,33 +445,20 @@ async def delete_recording(
     Delete a recording
     """
     try:
-        recording_uuid = UUID(recording_id)
+        # Check permissions - simplified (in production, verify user is owner/participant)
         
-        # Check if recording exists
-        recording = recording_repo.find_by_id(recording_uuid)
-        if not recording:
+        # The delete is conditional on the recording existing, so no pre-read is needed
+        deleted = recording_repo.delete(recording_id)
+        
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording not found"
             )
         
-        # Check permissions - simplified (in production, verify user is owner/participant)
-        
-        # Delete recording using repository
-        success = recording_repo.delete(recording_uuid)
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to delete recording"
-            )
+        await get_redis_service().bump_cache_version(_RECORDINGS_CACHE_NAMESPACE)
         
         return {"message": "Recording deleted successfully"}
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid recording ID format"
-        )
     except HTTPException:
         raise
     except Exception as e:
@@ -309,7 +468,10 @@ async def delete_recording(
         )
 
 @router.post("/{recording_id}/share")
-async def share_recording(recording_id: str):
+async def share_recording(
+    recording_id: RecordingId,
+    current_user: User = Depends(get_current_user)
+):
     """
     Generate shareable link for recording
     """
@@ -318,12 +480,9 @@ async def share_recording(recording_id: str):
         # 1. Generate temporary access token
         # 2. Create shareable URL
         
-        # Generate dynamic share URL based on current domain
-        base_domain = os.getenv('RAILWAY_PUBLIC_DOMAIN', 'localhost:8000')
-        protocol = 'https' if 'railway.app' in base_domain else 'http'
-        
+        # Generate share URL based on the deployment domain
         return {
-            "share_url": f"{protocol}://{base_domain}/shared/recordings/{recording_id}?token=abc123",
+            "share_url": f"{_SHARE_BASE_URL}/shared/recordings/{recording_id}?token=abc123",
             "expires_at": "2023-12-02T10:00:00Z"
         }
     except Exception as e:
@@ -332,9 +491,177 @@ async def share_recording(recording_id: str):
             detail=str(e)
         )
 
+def _ensure_transcript_access(recording: Dict[str, Any], current_user: User, recording_id: UUID) -> None:
+    """Raise 403 unless the user may read this recording document's transcript"""
+    has_access = False
+    current_user_id = str(current_user.id)
+    
+    # Creator always has access
+    if recording.get("creator_id") == current_user_id:
+        has_access = True
+    # Check if user was a participant in the recording
+    elif recording.get("participants"):
+        if current_user_id in recording["participants"]:
+            has_access = True
+    # Alternative: check if recording is from a room the user was in
+    elif recording.get("room_id"):
+        # This would require checking room participation history
+        # For now, we'll be more permissive for development
+        logger.warning(f"⚠️ Permissive access granted for recording {recording_id}")
+        has_access = True
+    
+    if not has_access:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+
+def _segment_words(words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Split Whisper words into transcript segments with alternating speakers
+    
+    A segment closes on a word that ends a sentence or once it runs past 30
+    seconds. Sentence ends are located for all words at once with NumPy, so
+    the Python loop runs once per segment instead of once per word.
+    
+    Args:
+        words: Word dicts with "word", "start" and "end" keys
+    
+    Returns:
+        List of transcript entries
+    """
+    count = len(words)
+    starts = np.fromiter((w.get("start", 0) for w in words), dtype=np.float64, count=count)
+    ends = np.fromiter((w.get("end", 0) for w in words), dtype=np.float64, count=count)
+    sentence_ends = np.flatnonzero(np.fromiter(
+        (w["word"][-1:] in _END_PUNCT for w in words), dtype=bool, count=count
+    ))
+    
+    transcript_entries = []
+    current_speaker = "user-1"
+    first = 0
+    
+    while first < count:
+        # Segment runs to the next sentence end (or the last word)...
+        next_end = np.searchsorted(sentence_ends, first)
+        last = sentence_ends[next_end] if next_end < len(sentence_ends) else count - 1
+        
+        # ...unless it passes 30 seconds first
+        too_long = np.flatnonzero(ends[first:last + 1] - starts[first] > 30.0)
+        if too_long.size:
+            last = first + too_long[0]
+        last = int(last)
+        
+        segment = words[first:last + 1]
+        start_time = segment[0].get("start", 0)
+        text = " ".join(w["word"] for w in segment)
+        
+        transcript_entries.append({
+            "speaker": current_speaker,
+            "timestamp": f"{int(start_time//60):02d}:{int(start_time%60):02d}",
+            "text": text.strip(),
+            "start_time": start_time,
+            "confidence": segment[-1].get("confidence", 0.0)
+        })
+        
+        # Alternate speaker (simplified)
+        current_speaker = "user-2" if current_speaker == "user-1" else "user-1"
+        first = last + 1
+    
+    return transcript_entries
+
+async def _compute_transcript(
+    recording_id: UUID,
+    recording: Dict[str, Any],
+    recording_repo,
+    background_tasks: BackgroundTasks
+) -> Dict[str, Any]:
+    """
+    Return a recording's transcript, generating it with Whisper on a cache miss
+    
+    Shared by the transcript and summary endpoints, which load the recording
+    and check access themselves.
+    
+    Args:
+        recording_id: Recording's UUID
+        recording: Recording document from find_with_transcript
+        recording_repo: Recording repository used to cache a new transcript
+        background_tasks: Request's background tasks; the cache write runs after the response
+    
+    Returns:
+        Dictionary with the transcript entries, plus language, duration and
+        processing info when freshly generated
+    """
+    # Return the cached transcript without touching storage or OpenAI
+    transcript_data = recording.get("transcript_data")
+    if transcript_data:
+        return {"transcript": transcript_data}
+    
+    download_url = recording.get("download_url")
+    if not download_url:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Recording file not found"
+        )
+    
+    # Stream the audio into a spooled file so at most one chunk is held in
+    # memory; the OpenAI client then streams it back out from the file
+    http_session = container.get_http_session()
+    with tempfile.SpooledTemporaryFile(max_size=_AUDIO_CHUNK_SIZE) as audio_file:
+        async with http_session.get(download_url) as audio_response:
+            if audio_response.status != 200:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to download recording file"
+                )
+            
+            async for chunk in audio_response.content.iter_chunked(_AUDIO_CHUNK_SIZE):
+                audio_file.write(chunk)
+        
+        audio_file.seek(0)
+        
+        # Get OpenAI service and perform STT
+        openai_service = get_openai_service()
+        stt_result = await openai_service.speech_to_text(
+            audio_file=(f"recording_{recording_id}.wav", audio_file),
+            language="en-US"  # Could be configurable
+        )
+    
+    # Parse words for speaker diarization (simplified)
+    words = stt_result.get("words", [])
+    
+    if words:
+        transcript_entries = _segment_words(words)
+    else:
+        # Fallback: single transcript entry
+        transcript_entries = [{
+            "speaker": "user-1",
+            "timestamp": "00:00:00",
+            "text": stt_result["text"],
+            "start_time": 0,
+            "confidence": stt_result.get("confidence", 0.0)
+        }]
+    
+    # Cache the transcript for future requests once the response has been sent
+    # (update_transcript logs and swallows its own errors)
+    background_tasks.add_task(recording_repo.update_transcript, recording_id, transcript_entries)
+    
+    return {
+        "transcript": transcript_entries,
+        "language": stt_result.get("language", "unknown"),
+        "duration": stt_result.get("duration", 0),
+        "processing_info": {
+            "model": "whisper-1",
+            "processed_at": datetime.utcnow()
+        }
+    }
+
 @router.get("/{recording_id}/transcript")
 async def get_recording_transcript(
-    recording_id: str,
+    recording_id: RecordingId,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     recording_repo = Depends(get_recording_repository),
     current_user: User = Depends(get_current_user)
 ):
@@ -342,131 +669,29 @@ async def get_recording_transcript(
     Get recording transcript using OpenAI Whisper
     """
     try:
-        import io
-        from infrastructure.container import container
-        
-        # Get recording details
-        recording = recording_repo.find_by_id(recording_id)
+        # Single read: access fields, cached transcript and file URL together
+        recording = recording_repo.find_with_transcript(recording_id)
         if not recording:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording not found"
             )
         
-        # Check if user has access to this recording
-        has_access = False
+        _ensure_transcript_access(recording, current_user, recording_id)
         
-        # Creator always has access
-        if recording.created_by == current_user.id:
-            has_access = True
-        # Check if user was a participant in the recording
-        elif hasattr(recording, 'participants') and recording.participants:
-            if current_user.id in recording.participants:
-                has_access = True
-        # Alternative: check if recording is from a room the user was in
-        elif hasattr(recording, 'room_id') and recording.room_id:
-            # This would require checking room participation history
-            # For now, we'll be more permissive for development
-            logger.warning(f"⚠️ Permissive access granted for recording {recording_id}")
-            has_access = True
-            
-        if not has_access:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied"
-            )
-        
-        # Check if transcript already exists (cache)
-        if hasattr(recording, 'transcript_data') and recording.transcript_data:
-            return {"transcript": recording.transcript_data}
-        
-        # Get audio file URL and download for processing
-        download_url = recording_repo.get_download_url(recording_id)
-        if not download_url:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Recording file not found"
-            )
-        
-        # Download audio file for STT processing
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.get(download_url) as response:
-                if response.status != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Failed to download recording file"
-                    )
-                
-                audio_content = await response.read()
-        
-        # Create audio buffer for OpenAI
-        audio_buffer = io.BytesIO(audio_content)
-        audio_buffer.name = f"recording_{recording_id}.wav"
-        
-        # Get OpenAI service and perform STT
-        openai_service = container.get_openai_service()
-        stt_result = await openai_service.speech_to_text(
-            audio_file=audio_buffer,
-            language="en-US"  # Could be configurable
+        transcript_response = await _compute_transcript(
+            recording_id, recording, recording_repo, background_tasks
         )
         
-        # Parse words for speaker diarization (simplified)
-        transcript_entries = []
-        words = stt_result.get("words", [])
+        # Encode the entries once: the same bytes version the ETag and are spliced into the body
+        transcript_json = orjson.dumps(transcript_response["transcript"], option=orjson.OPT_SORT_KEYS)
+        etag = _weak_etag(recording_id, hashlib.blake2b(transcript_json, digest_size=8).hexdigest())
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
         
-        if words:
-            # Group words into segments (simplified speaker detection)
-            current_segment = []
-            current_speaker = "user-1"
-            
-            for word in words:
-                current_segment.append(word["word"])
-                
-                # Simple heuristic: new speaker every 30 seconds or sentence break
-                if (word.get("end", 0) - (current_segment[0] if current_segment else {"start": 0})["start"] > 30.0 
-                    or word["word"].endswith(('.', '!', '?'))):
-                    
-                    if current_segment:
-                        text = " ".join([w["word"] if isinstance(w, dict) else w for w in current_segment])
-                        start_time = current_segment[0]["start"] if isinstance(current_segment[0], dict) else 0
-                        
-                        transcript_entries.append({
-                            "speaker": current_speaker,
-                            "timestamp": f"{int(start_time//60):02d}:{int(start_time%60):02d}",
-                            "text": text.strip(),
-                            "start_time": start_time,
-                            "confidence": word.get("confidence", 0.0)
-                        })
-                        
-                        # Alternate speaker (simplified)
-                        current_speaker = "user-2" if current_speaker == "user-1" else "user-1"
-                        current_segment = []
-        else:
-            # Fallback: single transcript entry
-            transcript_entries = [{
-                "speaker": "user-1",
-                "timestamp": "00:00:00",
-                "text": stt_result["text"],
-                "start_time": 0,
-                "confidence": stt_result.get("confidence", 0.0)
-            }]
-        
-        # Cache the transcript for future requests
-        try:
-            recording_repo.update_transcript(recording_id, transcript_entries)
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to cache transcript: {e}")
-        
-        return {
-            "transcript": transcript_entries,
-            "language": stt_result.get("language", "unknown"),
-            "duration": stt_result.get("duration", 0),
-            "processing_info": {
-                "model": "whisper-1",
-                "processed_at": datetime.utcnow().isoformat()
-            }
-        }
+        body = orjson.dumps({**transcript_response, "transcript": orjson.Fragment(transcript_json)})
+        return Response(content=body, media_type="application/json", headers=dict(response.headers))
         
     except HTTPException:
         raise
@@ -477,10 +702,187 @@ async def get_recording_transcript(
             detail=f"Failed to generate transcript: {str(e)}"
         ) 
 
+def _sse_event(event: str, data: Any) -> bytes:
+    """Encode one server-sent event"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+@router.get("/{recording_id}/transcript/stream")
+async def stream_recording_transcript(
+    recording_id: RecordingId,
+    background_tasks: BackgroundTasks,
+    recording_repo = Depends(get_recording_repository),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream the recording transcript as server-sent events
+    
+    Sends a "status" event at once ("cached" or "processing"), then one
+    "segment" event per transcript entry, then a "done" event carrying the
+    language/duration/processing info, or an "error" event on failure.
+    """
+    recording = recording_repo.find_with_transcript(recording_id)
+    if not recording:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Recording not found"
+        )
+    
+    _ensure_transcript_access(recording, current_user, recording_id)
+    
+    async def events():
+        state = "cached" if recording.get("transcript_data") else "processing"
+        yield _sse_event("status", {"state": state})
+        
+        try:
+            transcript_response = await _compute_transcript(
+                recording_id, recording, recording_repo, background_tasks
+            )
+        except HTTPException as e:
+            yield _sse_event("error", {"detail": e.detail})
+            return
+        except Exception as e:
+            logger.error(f"❌ Transcript stream failed: {e}")
+            yield _sse_event("error", {"detail": "Failed to generate transcript"})
+            return
+        
+        for entry in transcript_response["transcript"]:
+            yield _sse_event("segment", entry)
+        
+        yield _sse_event("done", {
+            key: value for key, value in transcript_response.items() if key != "transcript"
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+async def _generate_summary(transcript_response: Dict[str, Any], summary_type: str) -> Dict[str, Any]:
+    """
+    Summarize a transcript and extract its topics with OpenAI
+    
+    Args:
+        transcript_response: Result of _compute_transcript
+        summary_type: brief, detailed or highlights
+    
+    Returns:
+        JSON-ready summary payload (cached as is in Redis)
+    """
+    transcript_entries = transcript_response["transcript"]
+    
+    # Prepare conversation text for summarization in one join
+    conversation_text = "".join(
+        f"{entry['speaker']}: {entry['text']}\n" for entry in transcript_entries
+    )
+    speakers = {entry["speaker"] for entry in transcript_entries}
+    
+    # Get OpenAI service for summarization
+    openai_service = get_openai_service()
+    
+    # Create context for summarization
+    context = {
+        "conversation_length": len(transcript_entries),
+        "duration": transcript_response.get("duration", 0),
+        "speakers": list(speakers),
+        "summary_type": summary_type
+    }
+    
+    # Summary and topic extraction are independent, so run them together
+    summary_response, topics_result = await asyncio.gather(
+        openai_service.generate_conversation_summary(
+            conversation_text=conversation_text,
+            context=context,
+            summary_type=summary_type
+        ),
+        openai_service.extract_topics_and_hashtags(
+            text=conversation_text,
+            context={
+                "source": "conversation_summary",
+                "participants": list(speakers)
+            }
+        )
+    )
+    
+    return {
+        "summary": {
+            "brief": summary_response.get("brief_summary", ""),
+            "detailed": summary_response.get("detailed_summary", ""),
+            "key_points": summary_response.get("key_points", []),
+            "highlights": summary_response.get("highlights", []),
+            "action_items": summary_response.get("action_items", []),
+            "insights": summary_response.get("insights", [])
+        },
+        "analysis": {
+            "main_topics": topics_result.get("main_topics", []),
+            "hashtags": topics_result.get("hashtags", []),
+            "sentiment": topics_result.get("sentiment", "neutral"),
+            "conversation_style": topics_result.get("conversation_style", "casual")
+        },
+        "metadata": {
+            "duration": transcript_response.get("duration", 0),
+            "word_count": len(conversation_text.split()),
+            "speakers": list(speakers),
+            "language": transcript_response.get("language", "unknown"),
+            "generated_at": datetime.utcnow().isoformat()
+        }
+    }
+
+async def _coalesced_summary(cache_key: str, transcript_response: Dict[str, Any], summary_type: str) -> Dict[str, Any]:
+    """
+    Return a summary, generating it at most once across concurrent requests
+    
+    The first request takes a Redis lock and generates the summary; concurrent
+    requests for the same key poll for its result instead of paying for their
+    own OpenAI calls. If the holder fails, the lock is released (or expires)
+    and a waiter generates it; waiters also stop waiting after the lock TTL.
+    If Redis is unreachable the summary is generated straight away.
+    
+    Args:
+        cache_key: Redis key for this recording, summary type and transcript version
+        transcript_response: Result of _compute_transcript
+        summary_type: brief, detailed or highlights
+    
+    Returns:
+        Summary payload
+    """
+    redis_service = get_redis_service()
+    lock_key = f"{cache_key}:lock"
+    give_up_at = time.monotonic() + _SUMMARY_LOCK_TTL
+    
+    while True:
+        cached = await redis_service.get_cached_response(cache_key)
+        if cached:
+            return orjson.loads(cached)
+        
+        try:
+            lock_token = await redis_service.acquire_lock(lock_key, _SUMMARY_LOCK_TTL)
+        except Exception as e:
+            logger.warning(f"⚠️ Summary lock unavailable ({e}), generating {cache_key} here")
+            return await _generate_summary(transcript_response, summary_type)
+        
+        if lock_token:
+            break
+        if time.monotonic() >= give_up_at:
+            logger.warning(f"⚠️ Gave up waiting for summary {cache_key}, generating it here")
+            return await _generate_summary(transcript_response, summary_type)
+        
+        await asyncio.sleep(_SUMMARY_POLL_INTERVAL)
+    
+    try:
+        summary = await _generate_summary(transcript_response, summary_type)
+        await redis_service.cache_response(cache_key, orjson.dumps(summary).decode(), _SUMMARY_CACHE_TTL)
+        return summary
+    finally:
+        await redis_service.release_lock(lock_key, lock_token)
+
 # NEW: Conversation Summary Endpoint
 @router.get("/{recording_id}/summary")
 async def get_conversation_summary(
-    recording_id: str,
+    recording_id: RecordingId,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     summary_type: str = "detailed",  # brief, detailed, highlights
     recording_repo = Depends(get_recording_repository),
     current_user: User = Depends(get_current_user)
@@ -489,42 +891,19 @@ async def get_conversation_summary(
     Generate AI-powered conversation summary
     """
     try:
-        from infrastructure.container import container
-        
         # Get recording details
-        recording = recording_repo.find_by_id(recording_id)
+        recording = recording_repo.find_with_transcript(recording_id)
         if not recording:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recording not found"
             )
         
-        # Check permissions
-        has_access = False
-        
-        # Creator always has access
-        if recording.created_by == current_user.id:
-            has_access = True
-        # Check if user was a participant in the recording
-        elif hasattr(recording, 'participants') and recording.participants:
-            if current_user.id in recording.participants:
-                has_access = True
-        # Alternative: check if recording is from a room the user was in
-        elif hasattr(recording, 'room_id') and recording.room_id:
-            # This would require checking room participation history
-            # For now, we'll be more permissive for development
-            logger.warning(f"⚠️ Permissive access granted for recording {recording_id}")
-            has_access = True
-            
-        if not has_access:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied"
-            )
+        _ensure_transcript_access(recording, current_user, recording_id)
         
         # Get transcript first
-        transcript_response = await get_recording_transcript(
-            recording_id, recording_repo, current_user
+        transcript_response = await _compute_transcript(
+            recording_id, recording, recording_repo, background_tasks
         )
         transcript_entries = transcript_response["transcript"]
         
@@ -534,66 +913,17 @@ async def get_conversation_summary(
                 detail="No transcript available for summarization"
             )
         
-        # Prepare conversation text for summarization
-        conversation_text = ""
-        speakers = set()
-        
-        for entry in transcript_entries:
-            speaker = entry["speaker"]
-            text = entry["text"]
-            speakers.add(speaker)
-            conversation_text += f"{speaker}: {text}\n"
-        
-        # Get OpenAI service for summarization
-        openai_service = container.get_openai_service()
-        
-        # Create context for summarization
-        context = {
-            "conversation_length": len(transcript_entries),
-            "duration": transcript_response.get("duration", 0),
-            "speakers": list(speakers),
-            "summary_type": summary_type
-        }
-        
-        # Generate summary using AI
-        summary_response = await openai_service.generate_conversation_summary(
-            conversation_text=conversation_text,
-            context=context,
-            summary_type=summary_type
-        )
-        
-        # Extract key insights and topics
-        topics_result = await openai_service.extract_topics_and_hashtags(
-            text=conversation_text,
-            context={
-                "source": "conversation_summary",
-                "participants": list(speakers)
-            }
-        )
-        
-        return {
-            "summary": {
-                "brief": summary_response.get("brief_summary", ""),
-                "detailed": summary_response.get("detailed_summary", ""),
-                "key_points": summary_response.get("key_points", []),
-                "highlights": summary_response.get("highlights", []),
-                "action_items": summary_response.get("action_items", []),
-                "insights": summary_response.get("insights", [])
-            },
-            "analysis": {
-                "main_topics": topics_result.get("main_topics", []),
-                "hashtags": topics_result.get("hashtags", []),
-                "sentiment": topics_result.get("sentiment", "neutral"),
-                "conversation_style": topics_result.get("conversation_style", "casual")
-            },
-            "metadata": {
-                "duration": transcript_response.get("duration", 0),
-                "word_count": len(conversation_text.split()),
-                "speakers": list(speakers),
-                "language": transcript_response.get("language", "unknown"),
-                "generated_at": datetime.utcnow().isoformat()
-            }
-        }
+        # An unchanged transcript means the client's summary is still current,
+        # so skip both OpenAI calls
+        transcript_digest = _transcript_digest(transcript_entries)
+        etag = _weak_etag("summary", recording_id, summary_type, transcript_digest)
+        not_modified = _not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+        
+        # Coalesce concurrent requests for the same summary onto one generation
+        cache_key = f"recording_summary:{recording_id}:{summary_type}:{transcript_digest}"
+        return await _coalesced_summary(cache_key, transcript_response, summary_type)
         
     except HTTPException:
         raise
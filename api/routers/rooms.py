@@ -2,26 +2,57 @@
 Rooms API routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect, Query
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 import asyncio
-import json
+import hashlib
 import logging
+import msgspec
+import orjson
+import os
+import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 
 from infrastructure.container import container
+from infrastructure.livekit.livekit_service import ROOM_TOKEN_REUSE_SECONDS
 from infrastructure.middleware.firebase_auth_middleware import get_current_user
 from domain.entities import RoomStatus, User, Room
-from uuid import uuid4
+from uuid import NAMESPACE_URL, uuid5
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Room listings are cached briefly in Redis; room writes made here bump the
+# namespace version, and the TTL bounds staleness from writes made elsewhere
+_ROOMS_CACHE_NAMESPACE = "rooms"
+_LIST_CACHE_TTL = 30
+
+# Room responses carry the caller's LiveKit token: cacheable by the client
+# only, and revalidated (ETag) on every use
+_ROOM_CACHE_CONTROL = "private, no-cache"
+
+# Namespace for topic IDs derived from topic names (see topic_id_for_name)
+_TOPIC_ID_NAMESPACE = uuid5(NAMESPACE_URL, "vortex:topic")
+
+# Pre-generated room IDs (see next_room_id)
+_ROOM_ID_POOL_SIZE = 256
+_room_id_pool: deque = deque()
+
+# Topic names change rarely: keep them in-process for a minute (see resolve_topic_names)
+_TOPIC_NAME_TTL_SECONDS = 60
+_TOPIC_NAME_CACHE_SIZE = 1024
+_topic_name_cache: Dict[UUID, Tuple[float, str]] = {}
 
 # Request/Response Models
 class RoomResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     name: str
     topic: str
@@ -30,9 +61,14 @@ class RoomResponse(BaseModel):
     status: str
     created_at: str
     livekit_room_name: str
-    livekit_token: str
+    livekit_token: Optional[str] = Field(
+        None,
+        description="LiveKit access token, issued by create, join and get room; null in room listings (join the room to get one)"
+    )
 
 class ParticipantResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     user_id: str
     display_name: str
     joined_at: str
@@ -40,11 +76,69 @@ class ParticipantResponse(BaseModel):
     connection_quality: str
 
 class RoomListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     rooms: List[RoomResponse]
     total: int
 
+# Wire forms of RoomResponse / ParticipantResponse. Handlers build these from
+# trusted entities and encode them with msgspec, skipping Pydantic validation;
+# the Pydantic models above stay as the routes' documented response_model
+class RoomPayload(msgspec.Struct):
+    id: str
+    name: str
+    topic: str
+    participants: Tuple[str, ...]
+    max_participants: int
+    status: str
+    created_at: str
+    livekit_room_name: str
+    livekit_token: Optional[str] = None
+
+class ParticipantPayload(msgspec.Struct):
+    user_id: str
+    display_name: str
+    joined_at: str
+    is_speaking: bool
+    connection_quality: str
+
+class RoomListPayload(msgspec.Struct):
+    rooms: List[RoomPayload]
+    total: int
+
+_JSON_ENCODER = msgspec.json.Encoder()
+
+def _room_payload(room: Room, topic: str, livekit_token: Optional[str] = None) -> RoomPayload:
+    """Build the response payload of a room"""
+    return RoomPayload(
+        id=str(room.id),
+        name=room.name,
+        topic=topic,
+        participants=room.participant_ids,
+        max_participants=room.max_participants,
+        status=room.status_str,
+        created_at=room.created_at_iso,
+        livekit_room_name=room.livekit_room_name,
+        livekit_token=livekit_token
+    )
+
+def _room_etag(room: Room, user_id: UUID) -> str:
+    """
+    Weak ETag of a user's room response
+    
+    Covers the room's last write and the user's LiveKit token reuse window, so
+    it changes whenever the room or the token the user would be issued does.
+    """
+    parts = (room.id, room.updated_at or room.created_at, user_id, int(time.time() // ROOM_TOKEN_REUSE_SECONDS))
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+def _json_response(payload) -> Response:
+    """Encode a payload struct (or a list of them) straight to a JSON response"""
+    return Response(content=_JSON_ENCODER.encode(payload), media_type="application/json")
+
 class JoinRoomRequest(BaseModel):
-    room_id: str
+    room_id: UUID
 
 class CreateRoomRequest(BaseModel):
     name: str
@@ -52,371 +146,369 @@ class CreateRoomRequest(BaseModel):
     max_participants: int = 10
     is_private: bool = False
 
-# Dependency injection
-def get_room_repository():
+# Dependency injection (async so FastAPI resolves them on the event loop, not the thread pool)
+async def get_room_repository():
     return container.get_room_repository()
 
-def get_user_repository():
+async def get_user_repository():
     return container.get_user_repository()
 
-def get_topic_repository():
-    return container.get_topic_repository()
+async def get_topic_repository(request: Request):
+    # Resolved once at startup (see lifespan); the container is the fallback
+    # when the app started degraded
+    topic_repo = getattr(request.app.state, "topic_repo", None)
+    return topic_repo if topic_repo is not None else container.get_topic_repository()
 
 # Helper functions
-def get_topic_name(topic_id: UUID, topic_repo) -> str:
-    """Get topic name by ID, fallback to 'General' if not found"""
-    try:
-        topic = topic_repo.find_by_id(topic_id)
-        return topic.name if topic else "General"
-    except:
-        return "General"
+def resolve_topic_names(topic_ids: Iterable[UUID], topic_repo) -> Dict[UUID, str]:
+    """
+    Names of the given topics, for the ones that exist
+    
+    Served from an in-process cache for up to _TOPIC_NAME_TTL_SECONDS; the
+    misses are read with one batched find_by_ids (blocking, so call it from a
+    worker thread).
+    """
+    now = time.monotonic()
+    names = {}
+    missing = []
+    for topic_id in topic_ids:
+        cached = _topic_name_cache.get(topic_id)
+        if cached and cached[0] > now:
+            names[topic_id] = cached[1]
+        else:
+            missing.append(topic_id)
+    
+    if missing:
+        if len(_topic_name_cache) >= _TOPIC_NAME_CACHE_SIZE:
+            _topic_name_cache.clear()
+        expires_at = now + _TOPIC_NAME_TTL_SECONDS
+        for topic_id, topic in topic_repo.find_by_ids(missing).items():
+            _topic_name_cache[topic_id] = (expires_at, topic.name)
+            names[topic_id] = topic.name
+    return names
+
+def get_room_topic_name(room: Room, topic_repo) -> str:
+    """Topic name of a room: the denormalized name when stored, else a (cached) topic lookup"""
+    if room.topic_name:
+        return room.topic_name
+    return resolve_topic_names((room.topic_id,), topic_repo).get(room.topic_id, "General")
+
+@lru_cache(maxsize=1024)
+def topic_id_for_name(topic: str) -> UUID:
+    """
+    Stable topic ID for a topic name
+    
+    Derived (UUIDv5) from the normalized name, so every room created with the
+    same topic shares one ID, in every process, without a lookup or a write.
+    """
+    return uuid5(_TOPIC_ID_NAMESPACE, topic.strip().lower())
+
+def next_room_id() -> UUID:
+    """
+    Random (version 4) room ID
+    
+    Drawn from a pool refilled with one os.urandom read per _ROOM_ID_POOL_SIZE
+    IDs, instead of one read per room.
+    """
+    if not _room_id_pool:
+        raw = os.urandom(16 * _ROOM_ID_POOL_SIZE)
+        _room_id_pool.extend(UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16))
+    return _room_id_pool.popleft()
 
 # Helper function to create a room for API
 def create_room_entity(name: str, topic: str, created_by: UUID, max_participants: int = 10, is_private: bool = False) -> Room:
     """Create a room entity for API usage"""
-    room_id = uuid4()
-    # For now, we'll use a generated UUID for topic_id
-    # In a real implementation, you would lookup the topic by name
-    topic_id = uuid4()
+    room_id = next_room_id()
+    room_id_str = str(room_id)
+    topic_id = topic_id_for_name(topic)
     
     return Room(
         id=room_id,
         name=name,
         topic_id=topic_id,
-        livekit_room_name=f"room_{room_id}",
-        host_ai_identity=f"ai_host_{room_id}",
+        livekit_room_name="room_" + room_id_str,
+        host_ai_identity="ai_host_" + room_id_str,
         max_participants=max_participants,
         created_by=created_by,
-        is_private=is_private
+        is_private=is_private,
+        topic_name=topic
     )
 
+async def _deploy_room_agent(room: Room, topic: Optional[str]) -> None:
+    """
+    Deploy VortexAgent to a newly created room
+    
+    Runs as a background task after the create response has been sent, so
+    agent start-up and its failures never add to room creation latency.
+    
+    Args:
+        room: The saved room entity
+        topic: Topic the room was created with, used as the agent's context
+    """
+    logger.info(f"🚀 ROOM CREATION DEBUG: Starting VortexAgent deployment for room: {room.name}")
+    logger.info(f"🚀 ROOM CREATION DEBUG: Room ID: {room.id}")
+    logger.info(f"🚀 ROOM CREATION DEBUG: LiveKit room name: {room.livekit_room_name}")
+    
+    try:
+        agent_manager = container.get_agent_manager_service()
+        logger.info(f"🔍 CONTAINER DEBUG: Agent manager retrieved: {agent_manager is not None}")
+        
+        if agent_manager:
+            logger.info(f"🤖 DEPLOYMENT DEBUG: Deploying VortexAgent to new room: {room.name}")
+            logger.info(f"🤖 DEPLOYMENT DEBUG: Room entity: {type(room)}")
+            logger.info(f"🤖 DEPLOYMENT DEBUG: Room host_ai_identity: {getattr(room, 'host_ai_identity', 'NOT FOUND')}")
+            
+            # Extract topics for the agent context
+            room_topics = [topic] if topic else ["general discussion"]
+            logger.info(f"🤖 DEPLOYMENT DEBUG: Room topics: {room_topics}")
+            
+            # Deploy the agent
+            logger.info(f"🤖 DEPLOYMENT DEBUG: About to call deploy_agent_to_room...")
+            deployment_result = await agent_manager.deploy_agent_to_room(
+                room=room,
+                room_topics=room_topics,
+                custom_settings={
+                    "auto_greet": True,
+                    "personality": "friendly",
+                    "engagement_level": 8
+                }
+            )
+            
+            logger.info(f"🤖 DEPLOYMENT DEBUG: Deployment result: {deployment_result}")
+            
+            if deployment_result.get("success"):
+                logger.info(f"✅ VortexAgent deployed successfully to room: {room.name}")
+                logger.info(f"✅ DEPLOYMENT SUCCESS: Agent identity: {deployment_result.get('agent_identity')}")
+                logger.info(f"✅ DEPLOYMENT SUCCESS: Context: {deployment_result.get('context')}")
+            else:
+                logger.error(f"❌ VortexAgent deployment failed for room: {room.name}")
+                logger.error(f"❌ DEPLOYMENT FAILURE: Error: {deployment_result.get('error')}")
+                logger.error(f"❌ DEPLOYMENT FAILURE: Full result: {deployment_result}")
+        else:
+            logger.error("❌ CRITICAL: Agent manager service not available - no AI host will be deployed")
+            logger.error(f"❌ CRITICAL: Container services: {[attr for attr in dir(container) if not attr.startswith('_')]}")
+    
+    except Exception as agent_error:
+        logger.error(f"❌ EXCEPTION: Error deploying VortexAgent: {agent_error}")
+        logger.error(f"❌ EXCEPTION: Error type: {type(agent_error)}")
+        import traceback
+        logger.error(f"❌ EXCEPTION: Traceback: {traceback.format_exc()}")
+        # Don't fail room creation if agent deployment fails
+
 # Room endpoints
 @router.post("/", response_model=RoomResponse)
 async def create_room(
     request: CreateRoomRequest,
+    background_tasks: BackgroundTasks,
     room_repo = Depends(get_room_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Create a new voice chat room
     """
-    try:
-        current_user_id = current_user.id
-        
-        # Create room entity
-        room = create_room_entity(
-            name=request.name,
-            topic=request.topic,
-            created_by=current_user_id,
-            max_participants=request.max_participants,
-            is_private=request.is_private
-        )
-        
-        # Save to repository
-        saved_room = await room_repo.save(room)
-        
-        # NEW: Automatically deploy VortexAgent to the room
-        logger.info(f"🚀 ROOM CREATION DEBUG: Starting VortexAgent deployment for room: {saved_room.name}")
-        logger.info(f"🚀 ROOM CREATION DEBUG: Room ID: {saved_room.id}")
-        logger.info(f"🚀 ROOM CREATION DEBUG: LiveKit room name: {saved_room.livekit_room_name}")
-        
-        try:
-            from infrastructure.container import container
-            logger.info(f"🔍 CONTAINER DEBUG: Container imported successfully")
-            
-            agent_manager = container.get_agent_manager_service()
-            logger.info(f"🔍 CONTAINER DEBUG: Agent manager retrieved: {agent_manager is not None}")
-            
-            if agent_manager:
-                logger.info(f"🤖 DEPLOYMENT DEBUG: Deploying VortexAgent to new room: {saved_room.name}")
-                logger.info(f"🤖 DEPLOYMENT DEBUG: Room entity: {type(saved_room)}")
-                logger.info(f"🤖 DEPLOYMENT DEBUG: Room host_ai_identity: {getattr(saved_room, 'host_ai_identity', 'NOT FOUND')}")
-                
-                # Extract topics for the agent context
-                room_topics = [request.topic] if request.topic else ["general discussion"]
-                logger.info(f"🤖 DEPLOYMENT DEBUG: Room topics: {room_topics}")
-                
-                # Deploy the agent
-                logger.info(f"🤖 DEPLOYMENT DEBUG: About to call deploy_agent_to_room...")
-                deployment_result = await agent_manager.deploy_agent_to_room(
-                    room=saved_room,
-                    room_topics=room_topics,
-                    custom_settings={
-                        "auto_greet": True,
-                        "personality": "friendly",
-                        "engagement_level": 8
-                    }
-                )
-                
-                logger.info(f"🤖 DEPLOYMENT DEBUG: Deployment result: {deployment_result}")
-                
-                if deployment_result.get("success"):
-                    logger.info(f"✅ VortexAgent deployed successfully to room: {saved_room.name}")
-                    logger.info(f"✅ DEPLOYMENT SUCCESS: Agent identity: {deployment_result.get('agent_identity')}")
-                    logger.info(f"✅ DEPLOYMENT SUCCESS: Context: {deployment_result.get('context')}")
-                else:
-                    logger.error(f"❌ VortexAgent deployment failed for room: {saved_room.name}")
-                    logger.error(f"❌ DEPLOYMENT FAILURE: Error: {deployment_result.get('error')}")
-                    logger.error(f"❌ DEPLOYMENT FAILURE: Full result: {deployment_result}")
-            else:
-                logger.error("❌ CRITICAL: Agent manager service not available - no AI host will be deployed")
-                logger.error(f"❌ CRITICAL: Container services: {[attr for attr in dir(container) if not attr.startswith('_')]}")
-                
-        except Exception as agent_error:
-            logger.error(f"❌ EXCEPTION: Error deploying VortexAgent: {agent_error}")
-            logger.error(f"❌ EXCEPTION: Error type: {type(agent_error)}")
-            import traceback
-            logger.error(f"❌ EXCEPTION: Traceback: {traceback.format_exc()}")
-            # Don't fail room creation if agent deployment fails
-        
-        return RoomResponse(
-            id=str(saved_room.id),
-            name=saved_room.name,
-            topic=request.topic,  # Use original topic string
-            participants=[str(p) for p in saved_room.current_participants],
-            max_participants=saved_room.max_participants,
-            status=saved_room.status.name.lower(),
-            created_at=saved_room.created_at.isoformat(),
-            livekit_room_name=saved_room.livekit_room_name,
-            livekit_token=room_repo.generate_livekit_token(saved_room.id, current_user_id),
-            ai_host_enabled=True  # Indicate AI host is enabled
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    current_user_id = current_user.id
+    
+    # Create room entity
+    room = create_room_entity(
+        name=request.name,
+        topic=request.topic,
+        created_by=current_user_id,
+        max_participants=request.max_participants,
+        is_private=request.is_private
+    )
+    
+    # Save to repository, issuing the creator's token with it
+    saved_room, livekit_token = await room_repo.save_with_token(room, current_user_id)
+    await container.get_redis_service().bump_cache_version(_ROOMS_CACHE_NAMESPACE)
+    
+    # Deploy VortexAgent once the response has been sent
+    background_tasks.add_task(_deploy_room_agent, saved_room, request.topic)
+    
+    return _json_response(_room_payload(
+        saved_room,
+        request.topic,  # Use original topic string
+        livekit_token
+    ))
 
 @router.post("/join", response_model=RoomResponse)
 async def join_room(
     request: JoinRoomRequest,
     room_repo = Depends(get_room_repository),
+    topic_repo = Depends(get_topic_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Join an existing room
     """
-    try:
-        room_id = UUID(request.room_id)
-        current_user_id = current_user.id
-        
-        # Check if room exists
-        room = room_repo.find_by_id(room_id)
-        if not room:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found"
-            )
-        
-        # Add user to room
-        if not room_repo.add_participant(room_id, current_user_id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to join room (room might be full)"
-            )
-        
-        # Get updated room info
-        updated_room = room_repo.find_by_id(room_id)
-        
-        # Get topic repository for topic name lookup
-        topic_repo = container.get_topic_repository()
-        
-        return RoomResponse(
-            id=str(updated_room.id),
-            name=updated_room.name,
-            topic=get_topic_name(updated_room.topic_id, topic_repo),
-            participants=[str(p) for p in updated_room.current_participants],
-            max_participants=updated_room.max_participants,
-            status=updated_room.status.name.lower(),
-            created_at=updated_room.created_at.isoformat(),
-            livekit_room_name=updated_room.livekit_room_name,
-            livekit_token=room_repo.generate_livekit_token(room_id, current_user_id)
-        )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid room ID format"
-        )
-    except Exception as e:
+    room_id = request.room_id
+    current_user_id = current_user.id
+    
+    # Check if room exists
+    room = await asyncio.to_thread(room_repo.get_by_id, room_id)
+    
+    # Add user to room (raises RoomFullError when there is no free seat)
+    if not await asyncio.to_thread(room_repo.add_participant, room_id, current_user_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            detail="Failed to join room"
         )
+    
+    # Joining doesn't change the topic, so the updated room and the topic
+    # name are read concurrently, alongside the cache version bump
+    updated_room, topic_name, _ = await asyncio.gather(
+        asyncio.to_thread(room_repo.get_by_id, room_id),
+        asyncio.to_thread(get_room_topic_name, room, topic_repo),
+        container.get_redis_service().bump_cache_version(_ROOMS_CACHE_NAMESPACE)
+    )
+    
+    return _json_response(_room_payload(
+        updated_room,
+        topic_name,
+        room_repo.generate_livekit_token(room_id, current_user_id)
+    ))
 
 @router.post("/{room_id}/leave")
 async def leave_room(
-    room_id: str,
+    room_id: UUID,
     room_repo = Depends(get_room_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Leave a room
     """
-    try:
-        room_uuid = UUID(room_id)
-        current_user_id = current_user.id
-        
-        # Check if room exists
-        room = room_repo.find_by_id(room_uuid)
-        if not room:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found"
-            )
-        
-        # Remove user from room
-        room_repo.remove_participant(room_uuid, current_user_id)
-        
-        return {"message": "Left room successfully"}
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid room ID format"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    current_user_id = current_user.id
+    
+    # Check if room exists
+    await asyncio.to_thread(room_repo.get_by_id, room_id)
+    
+    # Remove user from room
+    await asyncio.to_thread(room_repo.remove_participant, room_id, current_user_id)
+    room_repo.forget_livekit_token(room_id, current_user_id)
+    await container.get_redis_service().bump_cache_version(_ROOMS_CACHE_NAMESPACE)
+    
+    return {"message": "Left room successfully"}
 
 @router.get("/{room_id}", response_model=RoomResponse)
 async def get_room(
-    room_id: str,
+    room_id: UUID,
+    request: Request,
     room_repo = Depends(get_room_repository),
+    topic_repo = Depends(get_topic_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get room details
     """
-    try:
-        room_uuid = UUID(room_id)
-        current_user_id = current_user.id
-        
-        # Find room by ID
-        room = room_repo.find_by_id(room_uuid)
-        if not room:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found"
-            )
-        
-        # Get topic repository for topic name lookup
-        topic_repo = container.get_topic_repository()
-        
-        return RoomResponse(
-            id=str(room.id),
-            name=room.name,
-            topic=get_topic_name(room.topic_id, topic_repo),
-            participants=[str(p) for p in room.current_participants],
-            max_participants=room.max_participants,
-            status=room.status.name.lower(),
-            created_at=room.created_at.isoformat(),
-            livekit_room_name=room.livekit_room_name,
-            livekit_token=room_repo.generate_livekit_token(room_uuid, current_user_id)
-        )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid room ID format"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Room not found"
+    current_user_id = current_user.id
+    
+    # Find room by ID
+    room = await asyncio.to_thread(room_repo.get_by_id, room_id)
+    
+    # Polling clients that already hold this version skip the topic lookup and token signing
+    etag = _room_etag(room, current_user_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": _ROOM_CACHE_CONTROL}
         )
+    
+    response = _json_response(_room_payload(
+        room,
+        room.topic_name or await asyncio.to_thread(get_room_topic_name, room, topic_repo),
+        room_repo.generate_livekit_token(room_id, current_user_id)
+    ))
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _ROOM_CACHE_CONTROL
+    return response
 
 @router.get("/{room_id}/participants", response_model=List[ParticipantResponse])
 async def get_room_participants(
-    room_id: str,
+    room_id: UUID,
     room_repo = Depends(get_room_repository),
     user_repo = Depends(get_user_repository)
 ):
     """
     Get room participants
     """
-    try:
-        room_uuid = UUID(room_id)
-        
-        # Find room by ID
-        room = room_repo.find_by_id(room_uuid)
-        if not room:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found"
-            )
-        
-        # Get participant details
-        participants = []
-        for participant_id in room.current_participants:
-            user = user_repo.find_by_id(participant_id)
-            if user:
-                participants.append(ParticipantResponse(
-                    user_id=str(user.id),
-                    display_name=user.display_name,
-                    joined_at=room.created_at.isoformat(),  # Simplified - could track individual join times
-                    is_speaking=False,  # Would need LiveKit integration for real-time status
-                    connection_quality="good"  # Would need LiveKit integration for real status
-                ))
-        
-        return participants
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid room ID format"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Room not found"
+    # Find room by ID
+    room = await asyncio.to_thread(room_repo.get_by_id, room_id)
+    
+    # Get participant details with one batched read, keeping the room's participant order
+    users = await asyncio.to_thread(user_repo.find_by_ids, room.current_participants)
+    joined_at = room.participant_joined_at
+    
+    return _json_response([
+        ParticipantPayload(
+            user_id=str(user.id),
+            display_name=user.display_name,
+            # Participants who joined before join times were stored fall back to the room's creation
+            joined_at=joined_at.get(user.id, room.created_at).isoformat(),
+            is_speaking=False,  # Would need LiveKit integration for real-time status
+            connection_quality="good"  # Would need LiveKit integration for real status
         )
+        for user in map(users.get, room.current_participants)
+        if user
+    ])
 
 @router.get("/", response_model=RoomListResponse)
 async def get_rooms(
-    status: Optional[str] = None,
+    room_status: Optional[str] = Query(None, alias="status"),
     topic: Optional[str] = None,
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     room_repo = Depends(get_room_repository),
+    topic_repo = Depends(get_topic_repository),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get available rooms
+    
+    Listed rooms have no livekit_token; join a room (POST /join) to get one.
     """
-    try:
-        current_user_id = current_user.id
-        
-        # Get rooms from repository
-        if status == "active":
-            rooms = room_repo.find_active_rooms(limit=limit)
-        else:
-            rooms = room_repo.find_active_rooms(limit=limit)  # Default to active rooms
-        
-        # Get topic repository for topic name lookup
-        topic_repo = container.get_topic_repository()
-        
-        room_responses = []
-        for room in rooms:
-            room_responses.append(RoomResponse(
-                id=str(room.id),
-                name=room.name,
-                topic=get_topic_name(room.topic_id, topic_repo),
-                participants=[str(p) for p in room.current_participants],
-                max_participants=room.max_participants,
-                status=room.status.name.lower(),
-                created_at=room.created_at.isoformat(),
-                livekit_room_name=room.livekit_room_name,
-                livekit_token=room_repo.generate_livekit_token(room.id, current_user_id)
-            ))
-        
-        return RoomListResponse(
-            rooms=room_responses,
-            total=len(room_responses)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        ) 
+    # Read-through cache of the serialized listing. Listings carry no LiveKit
+    # tokens (those are issued by join), so one entry serves every user
+    redis_service = container.get_redis_service()
+    cache_version = await redis_service.get_cache_version(_ROOMS_CACHE_NAMESPACE)
+    cache_key = f"rooms:list:{cache_version}:{room_status}:{topic}:{limit}:{offset}"
+    cached = await redis_service.get_cached_response(cache_key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+    
+    # Get rooms from repository
+    if room_status == "active":
+        rooms = await asyncio.to_thread(room_repo.find_active_rooms, limit=limit)
+    else:
+        rooms = await asyncio.to_thread(room_repo.find_active_rooms, limit=limit)  # Default to active rooms
+    
+    # Rooms store their topic name; resolve the rest (older rooms) through the topic name cache
+    unnamed_topic_ids = {room.topic_id for room in rooms if not room.topic_name}
+    topic_names = await asyncio.to_thread(
+        resolve_topic_names, unnamed_topic_ids, topic_repo
+    ) if unnamed_topic_ids else {}
+    
+    # Rows come from trusted entities, so encode payload structs instead of
+    # validating a model per room
+    room_payloads = [
+        _room_payload(room, room.topic_name or topic_names.get(room.topic_id, "General"))
+        for room in rooms
+    ]
+    
+    body = _JSON_ENCODER.encode(RoomListPayload(rooms=room_payloads, total=len(room_payloads))).decode()
+    await redis_service.cache_response(cache_key, body, _LIST_CACHE_TTL)
+    
+    return Response(content=body, media_type="application/json")
+
+# WebSocket framing: orjson instead of the stdlib json behind send_json/receive_json
+async def send_ws_message(websocket: WebSocket, message: dict) -> None:
+    """Send a message to the client as a JSON text frame (through its room outbox once joined)"""
+    await get_websocket_manager().send_to_websocket(websocket, message)
+
+async def receive_ws_message(websocket: WebSocket) -> dict:
+    """Receive the next client message, from a JSON text or binary frame"""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    return orjson.loads(message.get("text") or message.get("bytes"))
 
 # Additional dependency injection for AI features
 def get_ai_host_service():
@@ -451,23 +543,23 @@ async def websocket_room_conversation(
     await websocket.accept()
     logger.info(f"🎭 GPT-4o Audio room WebSocket connected: room={room_id}, livekit={livekit_name}, user={user_id}")
     
+    websocket_manager = get_websocket_manager()
+    room_connection_id = None
     try:
         # 1) First check entity
-        room_repo = get_room_repository()
-        room = room_repo.find_by_id(UUID(room_id))
+        room_repo = await get_room_repository()
+        room = await asyncio.to_thread(room_repo.find_by_id, UUID(room_id))
         if not room:
-            await websocket.send_json({"type":"error","message":"Room not found"})
+            await send_ws_message(websocket, {"type":"error","message":"Room not found"})
             await websocket.close()
             return
 
-        # 2) Get user repository to check AI status FIRST
-        user_repo = get_user_repository()
-        current_user = user_repo.find_by_id(UUID(user_id))
-        user_ai_enabled = False  # Always start with AI disabled when joining any room
+        # 2) AI status: always start disabled when joining any room (no user read needed;
+        #    toggle_ai re-reads the persisted flag)
+        user_ai_enabled = False
         
         # 3) Connect to LiveKit with livekit_name
-        room_participants = [str(uid) for uid in room.current_participants]
-        websocket_manager = get_websocket_manager()
+        room_participants = list(room.participant_ids)
         room_connection_id = await websocket_manager.join_room(
             room_name=livekit_name,
             user_id=user_id,
@@ -475,7 +567,7 @@ async def websocket_room_conversation(
         )
         
         # 4) Send joined message
-        await websocket.send_json({
+        await send_ws_message(websocket, {
             "type": "room_joined",
             "room_id": room_id,
             "connection_id": room_connection_id,
@@ -497,7 +589,7 @@ async def websocket_room_conversation(
         # Main message handling loop
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = await receive_ws_message(websocket)
             message_type = data.get("type")
             
             logger.info(f"📥 Received: {message_type} in room {room_id}")
@@ -546,8 +638,8 @@ async def websocket_room_conversation(
                     websocket, room_id, user_id, data, livekit_name
                 )
                 # 🔄 Refresh user AI status for subsequent messages
-                user_repo = get_user_repository() # Re-get user_repo to ensure it's the latest
-                current_user = user_repo.find_by_id(UUID(user_id))
+                user_repo = await get_user_repository() # Re-get user_repo to ensure it's the latest
+                current_user = await asyncio.to_thread(user_repo.find_by_id, UUID(user_id))
                 user_ai_enabled = current_user.ai_enabled if current_user else False  # AI starts disabled by default
                 continue
                 
@@ -570,17 +662,20 @@ async def websocket_room_conversation(
                 
     except WebSocketDisconnect:
         logger.info(f"👋 User {user_id} disconnected from room {room_id}")
-        if 'room_connection_id' in locals():
-            await websocket_manager.leave_room(livekit_name, room_connection_id)
         
     except Exception as e:
         logger.error(f"❌ Room WebSocket error: {e}")
         logger.exception("Full exception details:")
-        await websocket.send_json({
+        await send_ws_message(websocket, {
             "type": "error",
             "error": str(e),
             "message": "Room connection error occurred"
         })
+    
+    finally:
+        # Leave on every exit path, so the outbox writer and room membership never outlive the socket
+        if room_connection_id:
+            await websocket_manager.leave_room(livekit_name, room_connection_id)
 
 
 async def handle_voice_message(
@@ -598,7 +693,7 @@ async def handle_voice_message(
     try:
         audio_data = data.get("audio_data")  # base64 encoded audio
         if not audio_data:
-            await websocket.send_json({
+            await send_ws_message(websocket, {
                 "type": "error", 
                 "message": "No audio data provided"
             })
@@ -659,7 +754,7 @@ async def handle_voice_message(
         
     except Exception as e:
         logger.error(f"❌ Voice message handling failed: {e}")
-        await websocket.send_json({
+        await send_ws_message(websocket, {
             "type": "error",
             "message": f"Failed to process voice message: {str(e)}"
         })
@@ -825,12 +920,12 @@ async def handle_ai_toggle_request(
         logger.info(f"🎛️ AI toggle requested by {user_id}: {ai_enabled}")
 
         # Persist to DB
-        user_repo = get_user_repository()
+        user_repo = await get_user_repository()
         from uuid import UUID as _UUID
-        user_entity = user_repo.find_by_id(_UUID(user_id))
+        user_entity = await asyncio.to_thread(user_repo.find_by_id, _UUID(user_id))
         if user_entity:
             user_entity.ai_enabled = bool(ai_enabled)
-            user_repo.update(user_entity)
+            await asyncio.to_thread(user_repo.update, user_entity)
             logger.info(f"✅ Persisted ai_enabled={ai_enabled} for user {user_id}")
         else:
             logger.warning(f"⚠️ Could not load user {user_id} to persist ai_enabled")
@@ -847,7 +942,7 @@ async def handle_ai_toggle_request(
         except Exception as apply_err:
             logger.warning(f"⚠️ Failed to apply room-wide AI toggle: {apply_err}")
 
-        await websocket.send_json({
+        await send_ws_message(websocket, {
             "type": "ai_toggle_response",
             "user_id": user_id,
             "ai_enabled": ai_enabled,
@@ -864,7 +959,7 @@ async def handle_ai_toggle_request(
         
     except Exception as e:
         logger.error(f"❌ AI toggle handling failed: {e}")
-        await websocket.send_json({
+        await send_ws_message(websocket, {
             "type": "error",
             "message": f"Failed to process AI toggle: {str(e)}"
         })
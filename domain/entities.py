@@ -3,8 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
+from functools import cached_property
 from enum import Enum, auto
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4
 
 
@@ -54,6 +55,14 @@ class UserStatus(Enum):
     IN_CALL = auto()
 
 
+# Lowercase status names as used in API payloads, built once instead of per serialized row
+_STATUS_NAMES = {
+    member: member.name.lower()
+    for status_enum in (CallStatus, RoomStatus, MatchStatus, FriendshipStatus, RecordingStatus, UserStatus)
+    for member in status_enum
+}
+
+
 # Domain Entities
 @dataclass
 class User:
@@ -127,16 +136,42 @@ class Room:
     created_by: UUID  # Creator ID
     max_participants: int = 10
     current_participants: List[UUID] = field(default_factory=list)
+    participant_joined_at: Dict[UUID, datetime] = field(default_factory=dict)  # When each current participant joined
     status: RoomStatus = RoomStatus.WAITING
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = None  # Last participant or status change, as stored
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
     is_private: bool = False
+    topic_name: Optional[str] = None  # Denormalized so listings don't read the topic
     
     # Recording settings
     is_recording_enabled: bool = True
     recording_id: Optional[UUID] = None
 
+    @property
+    def status_str(self) -> str:
+        """Lowercase status name as used in API payloads (not cached: status is mutable)"""
+        return _STATUS_NAMES[self.status]
+    
+    @cached_property
+    def created_at_iso(self) -> str:
+        """Creation time in ISO format (repositories may seed this from stored data)"""
+        return self.created_at.isoformat()
+    
+    @cached_property
+    def participant_ids(self) -> Tuple[str, ...]:
+        """
+        Current participant IDs as strings (repositories may seed this from stored data)
+        
+        Cached until the participants change; the domain behaviors below drop it.
+        """
+        return tuple(str(p) for p in self.current_participants)
+    
+    def _participants_changed(self) -> None:
+        """Drop the cached participant_ids after current_participants changed"""
+        self.__dict__.pop("participant_ids", None)
+    
     # Domain behaviors
     def add_participant(self, user_id: UUID) -> None:
         """Add participant"""
@@ -145,6 +180,8 @@ class Room:
         
         if user_id not in self.current_participants:
             self.current_participants.append(user_id)
+            self.participant_joined_at[user_id] = datetime.now(timezone.utc)
+            self._participants_changed()
             
         # If it's the first participant, activate the room
         if len(self.current_participants) == 1 and self.status == RoomStatus.WAITING:
@@ -154,6 +191,8 @@ class Room:
         """Remove participant"""
         if user_id in self.current_participants:
             self.current_participants.remove(user_id)
+            self.participant_joined_at.pop(user_id, None)
+            self._participants_changed()
             
         # If there are no participants left, end the room
         if len(self.current_participants) == 0:
@@ -175,6 +214,8 @@ class Room:
         self.status = RoomStatus.ENDED
         self.ended_at = datetime.now(timezone.utc)
         self.current_participants.clear()
+        self.participant_joined_at.clear()
+        self._participants_changed()
 
     def pause(self) -> None:
         """Pause chat"""
@@ -194,7 +235,7 @@ class Match:
     """
     id: UUID
     user_id: UUID
-    preferred_topics: List[UUID]
+    preferred_topics: List[UUID] = field(default_factory=list)
     max_participants: int = 3
     language_preference: Optional[str] = None
     status: MatchStatus = MatchStatus.PENDING
@@ -206,10 +247,16 @@ class Match:
     matched_users: List[UUID] = field(default_factory=list)
     selected_topic_id: Optional[UUID] = None
     room_id: Optional[UUID] = None
+    confidence: float = 1.0  # Match quality score (hashtag similarity for AI matches)
     
     queue_position: int = 0
-    estimated_wait_time: int = 0  # seconds
+    estimated_wait_time: int = 30  # seconds
 
+    @property
+    def status_str(self) -> str:
+        """Lowercase status name as used in API payloads (not cached: status is mutable)"""
+        return _STATUS_NAMES[self.status]
+    
     def mark_as_matched(self, matched_users: List[UUID], topic_id: UUID, room_id: UUID) -> None:
         """Mark as matched"""
         if self.status != MatchStatus.PENDING:
@@ -294,6 +341,33 @@ class Recording:
     share_token: Optional[str] = None
     share_expires_at: Optional[datetime] = None
 
+    # API string forms, computed on first use; id, room, creation time and
+    # participants are fixed once a recording exists
+    @cached_property
+    def id_str(self) -> str:
+        """Recording ID as a string"""
+        return str(self.id)
+    
+    @cached_property
+    def room_id_str(self) -> str:
+        """Room ID as a string"""
+        return str(self.room_id)
+    
+    @cached_property
+    def participant_ids(self) -> Tuple[str, ...]:
+        """Participant IDs as strings (repositories may seed this from stored data)"""
+        return tuple(str(p) for p in self.participants)
+    
+    @cached_property
+    def created_at_iso(self) -> str:
+        """Creation time in ISO format"""
+        return self.created_at.isoformat()
+    
+    @property
+    def status_str(self) -> str:
+        """Lowercase status name as used in API payloads (not cached: status is mutable)"""
+        return _STATUS_NAMES[self.status]
+    
     def mark_as_ready(self) -> None:
         """Mark as ready"""
         self.status = RecordingStatus.READY
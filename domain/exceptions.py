@@ -0,0 +1,27 @@
+"""
+Domain exceptions: business failures raised by repositories and services and
+mapped to HTTP responses once, by the app's exception handlers.
+"""
+from __future__ import annotations
+
+from uuid import UUID
+
+
+class DomainError(Exception):
+    """Base class for business rule failures"""
+
+
+class RoomNotFoundError(DomainError):
+    """The requested room does not exist"""
+    
+    def __init__(self, room_id: UUID) -> None:
+        super().__init__("Room not found")
+        self.room_id = room_id
+
+
+class RoomFullError(DomainError):
+    """The room has reached its maximum number of participants"""
+    
+    def __init__(self, room_id: UUID) -> None:
+        super().__init__("Failed to join room (room is full)")
+        self.room_id = room_id
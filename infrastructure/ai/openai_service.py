@@ -7,7 +7,7 @@ import base64
 import logging
 import openai
 from openai import AsyncOpenAI, DefaultAioHttpClient
-from typing import Dict, List, Any, Optional, Union, AsyncGenerator
+from typing import Dict, List, Any, Optional, Union, AsyncGenerator, BinaryIO, Tuple
 from datetime import datetime
 import json
 import asyncio
@@ -784,13 +784,14 @@ Be an active, helpful conversation facilitator.""",
             raise
 
     async def speech_to_text(
-        self, audio_file: Union[bytes, io.BytesIO], language: str = "en-US"
+        self, audio_file: Union[bytes, BinaryIO, Tuple[str, BinaryIO]], language: str = "en-US"
     ) -> Dict[str, Any]:
         """
         Convert speech to text using OpenAI Whisper API
         
         Args:
-            audio_file: Audio file data (bytes or BytesIO)
+            audio_file: Audio file data (bytes, a file object, or a (filename, file object) tuple
+                so large files are streamed from disk instead of loaded into memory)
             language: Language preference
             
         Returns:
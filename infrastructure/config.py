@@ -5,7 +5,7 @@ Configuration settings for the VoiceApp backend
 import os
 import json
 from typing import List
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -84,6 +84,10 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
+    # Per-process connection cap; callers wait up to REDIS_POOL_TIMEOUT seconds
+    # for a free connection instead of opening new ones under load
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: int = 5
     
     # Railway-specific Redis variables
     REDISHOST: str = ""
@@ -100,10 +104,16 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "ignore"  # Ignore additional environment variables
+    # Recordings - internal nginx location that proxies to storage, e.g.
+    #   location /_protected_storage/ { internal; proxy_pass https://firebasestorage.googleapis.com/...; }
+    # When set, downloads are handed off with X-Accel-Redirect instead of a redirect
+    RECORDING_ACCEL_REDIRECT_PREFIX: str = ""
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore"  # Ignore additional environment variables
+    )
         
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -216,6 +216,23 @@ class Container:
     def get_agent_manager_service(self) -> Optional[AgentManagerService]:
         """Get agent manager service for VortexAgent deployment"""
         return self._instances.get('agent_manager_service')
+    
+    def get_http_session(self):
+        """
+        Get the shared aiohttp session for outbound downloads
+        
+        Created on first use from inside the event loop, then reused so
+        requests share one keep-alive connection pool instead of opening
+        a session (and TLS handshake) each time.
+        """
+        session = self._instances.get('http_session')
+        if session is None or session.closed:
+            import aiohttp
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+            )
+            self._instances['http_session'] = session
+        return session
 
     # Lifecycle management methods
     async def start_websocket_services(self):
@@ -249,6 +266,11 @@ class Container:
             if hasattr(connection_manager, 'cleanup'):
                 await connection_manager.cleanup()
             
+            # Close shared HTTP session
+            http_session = self._instances.get('http_session')
+            if http_session is not None and not http_session.closed:
+                await http_session.close()
+            
             # Disconnect Redis
             redis_service = self.get_redis_service()
             if hasattr(redis_service, 'disconnect'):
@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Union
 import firebase_admin
 from firebase_admin import auth, credentials, firestore, storage
 from firebase_admin.exceptions import FirebaseError
+from google.api_core.exceptions import NotFound
 from google.cloud.firestore_v1 import DocumentReference, DocumentSnapshot
 
 from infrastructure.config import settings
@@ -180,11 +181,12 @@ class FirebaseAdminService:
             logger.error(f"❌ Failed to add document to {collection_name}: {e}")
             raise
 
-    def get_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
-        """Get document from Firestore"""
+    def get_document(self, collection_name: str, document_id: str,
+                     field_paths: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Get document from Firestore, optionally only the given fields (field mask)"""
         try:
             doc_ref = self.db.collection(collection_name).document(document_id)
-            doc = doc_ref.get()
+            doc = doc_ref.get(field_paths=field_paths)
             
             if doc.exists:
                 return doc.to_dict()
@@ -193,6 +195,29 @@ class FirebaseAdminService:
             logger.error(f"❌ Failed to get document {document_id} from {collection_name}: {e}")
             raise
 
+    def get_documents(self, collection_name: str, document_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several documents from Firestore in one batched read
+        
+        Args:
+            collection_name: Name of the collection
+            document_ids: IDs of the documents to fetch
+        
+        Returns:
+            Dictionary of document ID -> document data for the documents that exist
+        """
+        if not document_ids:
+            return {}
+        
+        try:
+            collection_ref = self.db.collection(collection_name)
+            refs = [collection_ref.document(document_id) for document_id in dict.fromkeys(document_ids)]
+            
+            return {doc.id: doc.to_dict() for doc in self.db.get_all(refs) if doc.exists}
+        except Exception as e:
+            logger.error(f"❌ Failed to get {len(document_ids)} documents from {collection_name}: {e}")
+            raise
+    
     def server_timestamp(self):
         """Return server timestamp for Firestore"""
         return firestore.SERVER_TIMESTAMP
@@ -202,8 +227,9 @@ class FirebaseAdminService:
         return firestore.SERVER_TIMESTAMP
 
     def query_documents(self, collection_name: str, filters: Optional[List[Dict[str, Any]]] = None, 
-                       limit: Optional[int] = None, order_by: Optional[str] = None, 
-                       order_direction: Optional[str] = "asc") -> List[Dict[str, Any]]:
+                       limit: Optional[int] = None, order_by: Optional[Union[str, List[str]]] = None, 
+                       order_direction: Optional[str] = "asc", offset: Optional[int] = None,
+                       start_after: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Query documents from Firestore collection with optional filters
         
@@ -211,8 +237,11 @@ class FirebaseAdminService:
             collection_name: Name of the collection
             filters: List of filter dictionaries with keys: field, operator, value
             limit: Maximum number of documents to return
-            order_by: Field to order by
+            order_by: Field to order by, or fields in priority order
+                ("__name__" orders by document ID)
             order_direction: Direction to order by ("asc" or "desc")
+            offset: Number of matching documents to skip (for pagination)
+            start_after: Values of the order_by fields to resume after (cursor pagination)
             
         Returns:
             List of document dictionaries
@@ -233,9 +262,14 @@ class FirebaseAdminService:
             if order_by:
                 from google.cloud.firestore import Query
                 direction = Query.DESCENDING if order_direction == "desc" else Query.ASCENDING
-                query = query.order_by(order_by, direction=direction)
+                for field in ([order_by] if isinstance(order_by, str) else order_by):
+                    query = query.order_by(field, direction=direction)
             
-            # Apply limit
+            # Apply pagination
+            if start_after:
+                query = query.start_after(start_after)
+            if offset:
+                query = query.offset(offset)
             if limit:
                 query = query.limit(limit)
             
@@ -255,6 +289,30 @@ class FirebaseAdminService:
             logger.error(f"❌ Failed to query documents from {collection_name}: {e}")
             raise
 
+    def count_documents(self, collection_name: str, filters: Optional[List[Dict[str, Any]]] = None) -> int:
+        """
+        Count the documents matching the filters with a server-side COUNT
+        aggregation (no documents are transferred)
+        
+        Args:
+            collection_name: Name of the collection
+            filters: List of filter dictionaries with keys: field, operator, value
+        
+        Returns:
+            Number of matching documents
+        """
+        try:
+            query = self.db.collection(collection_name)
+            for filter_dict in filters or []:
+                query = query.where(filter_dict['field'], filter_dict['operator'], filter_dict['value'])
+            
+            results = query.count().get()
+            return int(results[0][0].value)
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to count documents in {collection_name}: {e}")
+            raise
+    
     def update_document(self, collection_name: str, document_id: str, data: Dict[str, Any]) -> None:
         """Update document in Firestore"""
         try:
@@ -265,12 +323,30 @@ class FirebaseAdminService:
             logger.error(f"❌ Failed to update document {document_id} in {collection_name}: {e}")
             raise
 
-    def delete_document(self, collection_name: str, document_id: str) -> None:
-        """Delete document from Firestore"""
+    def delete_document(self, collection_name: str, document_id: str, must_exist: bool = False) -> bool:
+        """
+        Delete document from Firestore
+        
+        Args:
+            collection_name: Name of the collection
+            document_id: ID of the document to delete
+            must_exist: Make the delete conditional on the document existing, so
+                a missing document is detected without reading it first
+        
+        Returns:
+            False if must_exist is set and the document does not exist, else True
+        """
         try:
             doc_ref = self.db.collection(collection_name).document(document_id)
-            doc_ref.delete()
+            if must_exist:
+                doc_ref.delete(option=self.db.write_option(exists=True))
+            else:
+                doc_ref.delete()
             logger.info(f"✅ Deleted document {document_id} from {collection_name}")
+            return True
+        except NotFound:
+            logger.warning(f"⚠️ Document {document_id} not found in {collection_name}")
+            return False
         except Exception as e:
             logger.error(f"❌ Failed to delete document {document_id} from {collection_name}: {e}")
             raise
@@ -3,7 +3,10 @@ LiveKit Service for room management and token generation
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 
@@ -26,6 +29,14 @@ from infrastructure.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Lifetime of room tokens
+ROOM_TOKEN_TTL_SECONDS = 3600
+# Window within which generate_room_token hands back the same signed token: half
+# the lifetime, so a reused token always has at least 30 minutes left
+ROOM_TOKEN_REUSE_SECONDS = ROOM_TOKEN_TTL_SECONDS // 2
+# Most (room, user) pairs whose current token is kept
+ROOM_TOKEN_CACHE_SIZE = 4096
+
 
 class LiveKitService:
     """LiveKit service for room management and token generation"""
@@ -36,6 +47,10 @@ class LiveKitService:
         self.api_key = settings.LIVEKIT_API_KEY
         self.api_secret = settings.LIVEKIT_API_SECRET
         self.server_url = settings.LIVEKIT_SERVER_URL
+        # (room_id, user_id) -> (reuse window, signed token), least recently used first
+        self._room_tokens: "OrderedDict[Tuple[str, str], Tuple[int, str]]" = OrderedDict()
+        # Room handlers run in worker threads; guards every read and update of _room_tokens
+        self._room_tokens_lock = threading.Lock()
         
     def connect(self) -> None:
         """Initialize LiveKit connection"""
@@ -315,6 +330,10 @@ class LiveKitService:
         """
         Generate token for a specific room and user
         
+        Tokens are reused within a ROOM_TOKEN_REUSE_SECONDS window, so fetching
+        the same room repeatedly doesn't re-sign a JWT per request;
+        a reused token still has at least ttl - ROOM_TOKEN_REUSE_SECONDS left.
+        
         Args:
             room_id: Room UUID
             user_id: User UUID
@@ -322,6 +341,34 @@ class LiveKitService:
         Returns:
             JWT token
         """
+        reuse_window = int(time.time() // ROOM_TOKEN_REUSE_SECONDS)
+        return self._room_token(str(room_id), str(user_id), reuse_window)
+    
+    def forget_room_token(self, room_id: UUID, user_id: UUID) -> None:
+        """Drop the reusable token of a user for a room (e.g. when they leave it)"""
+        with self._room_tokens_lock:
+            self._room_tokens.pop((str(room_id), str(user_id)), None)
+    
+    def _room_token(self, room_id: str, user_id: str, reuse_window: int) -> str:
+        """Return the pair's token for this reuse window, signing a new one if needed"""
+        key = (room_id, user_id)
+        with self._room_tokens_lock:
+            cached = self._room_tokens.get(key)
+            if cached and cached[0] == reuse_window:
+                self._room_tokens.move_to_end(key)
+                return cached[1]
+        
+        # Sign outside the lock; two threads racing on the same pair just both sign
+        token = self._signed_room_token(room_id, user_id)
+        with self._room_tokens_lock:
+            self._room_tokens[key] = (reuse_window, token)
+            self._room_tokens.move_to_end(key)
+            if len(self._room_tokens) > ROOM_TOKEN_CACHE_SIZE:
+                self._room_tokens.popitem(last=False)
+        return token
+    
+    def _signed_room_token(self, room_id: str, user_id: str) -> str:
+        """Sign a room token with full publish/subscribe grants"""
         room_name = f"room_{room_id}"
         identity = f"user_{user_id}"
         
@@ -330,7 +377,8 @@ class LiveKitService:
             identity=identity,
             can_publish=True,
             can_subscribe=True,
-            can_publish_data=True
+            can_publish_data=True,
+            ttl=ROOM_TOKEN_TTL_SECONDS
         )
     
     # Participant Management
@@ -4,6 +4,7 @@ Redis Service for queue management and caching
 
 import json
 import redis
+import secrets
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 import asyncio
@@ -14,6 +15,19 @@ from infrastructure.config import Settings
 
 logger = logging.getLogger(__name__)
 
+MATCHING_QUEUE = 'matching_queue'
+# Hash of user_id -> queue member JSON, so a user's entry can be found with ZRANK/ZREM
+# instead of decoding every member of the sorted set
+MATCHING_QUEUE_INDEX = 'matching_queue:members'
+
+# Compare-and-delete: only the owner token written by acquire_lock may remove the lock
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
 def json_serializer(obj):
     """Custom JSON serializer for UUID and datetime objects"""
     if isinstance(obj, UUID):
@@ -60,22 +74,25 @@ class RedisService:
             redis_url = self._build_redis_url()
             logger.info(f"🔍 Connecting to Redis at: {redis_url.replace(self.settings.REDIS_PASSWORD, '***') if self.settings.REDIS_PASSWORD else redis_url}")
             
-            # Synchronous client
-            self.redis_client = redis.from_url(
-                redis_url,
+            # Bounded pools: at most REDIS_MAX_CONNECTIONS per client; when all are
+            # busy, callers wait for one to be returned rather than connecting again
+            pool_options = dict(
+                max_connections=self.settings.REDIS_MAX_CONNECTIONS,
+                timeout=self.settings.REDIS_POOL_TIMEOUT,
                 decode_responses=True,
                 socket_keepalive=True,
                 socket_keepalive_options={},
                 health_check_interval=30
             )
             
+            # Synchronous client
+            self.redis_client = redis.Redis(
+                connection_pool=redis.BlockingConnectionPool.from_url(redis_url, **pool_options)
+            )
+            
             # Asynchronous client
-            self.async_redis_client = redis.asyncio.from_url(
-                redis_url,
-                decode_responses=True,
-                socket_keepalive=True,
-                socket_keepalive_options={},
-                health_check_interval=30
+            self.async_redis_client = redis.asyncio.Redis(
+                connection_pool=redis.asyncio.BlockingConnectionPool.from_url(redis_url, **pool_options)
             )
             
             # Test connection
@@ -94,8 +111,14 @@ class RedisService:
         """Close Redis connection"""
         if self.redis_client:
             self.redis_client.close()
+            if not self.is_mock:
+                self.redis_client.connection_pool.disconnect()
         if self.async_redis_client:
-            asyncio.create_task(self.async_redis_client.close())
+            if self.is_mock:
+                asyncio.create_task(self.async_redis_client.close())
+            else:
+                # The pool was passed in explicitly, so close() leaves it open unless asked
+                asyncio.create_task(self.async_redis_client.close(close_connection_pool=True))
         logger.info("Redis connection closed")
     
     def health_check(self) -> bool:
@@ -115,7 +138,13 @@ class RedisService:
             
             # Use sorted set for priority queue
             score = priority * 1000000 + int(datetime.utcnow().timestamp())
-            return self.redis_client.zadd(queue_name, {json.dumps(item, default=json_serializer): score})
+            member = json.dumps(item, default=json_serializer)
+            added = self.redis_client.zadd(queue_name, {member: score})
+            
+            if queue_name == MATCHING_QUEUE and item.get('user_id'):
+                self.redis_client.hset(MATCHING_QUEUE_INDEX, str(item['user_id']), member)
+            
+            return added
         except Exception as e:
             logger.error(f"Failed to enqueue item: {e}")
             return False
@@ -213,6 +242,69 @@ class RedisService:
             logger.error(f"Failed to check key existence: {e}")
             return False
     
+    # Response caching (async client, so cache lookups don't block the event loop)
+    async def get_cache_version(self, namespace: str) -> str:
+        """Current version of a cache namespace; part of every key cached under it"""
+        try:
+            return await self.async_redis_client.get(f"cache_version:{namespace}") or "0"
+        except Exception as e:
+            logger.error(f"Failed to get cache version: {e}")
+            return "0"
+    
+    async def bump_cache_version(self, namespace: str) -> bool:
+        """Invalidate everything cached under a namespace by moving to a new version"""
+        try:
+            await self.async_redis_client.incr(f"cache_version:{namespace}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to bump cache version: {e}")
+            return False
+    
+    async def get_cached_response(self, key: str) -> Optional[str]:
+        """Get a pre-serialized response body"""
+        try:
+            return await self.async_redis_client.get(key)
+        except Exception as e:
+            logger.error(f"Failed to get cached response: {e}")
+            return None
+    
+    async def cache_response(self, key: str, body: str, ttl: int) -> bool:
+        """Store a pre-serialized response body with a TTL"""
+        try:
+            return bool(await self.async_redis_client.setex(key, ttl, body))
+        except Exception as e:
+            logger.error(f"Failed to cache response: {e}")
+            return False
+    
+    # Locks (async client; each holder gets an owner token so it can only release its own lock)
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """
+        Take a short-lived lock with SET NX EX under a random owner token
+        
+        Args:
+            key: Lock key
+            ttl: Seconds until the lock expires if it is never released
+        
+        Returns:
+            The owner token to pass to release_lock, or None if the lock is held
+        
+        Raises:
+            redis.RedisError: Redis is unreachable; callers should not treat
+                this as the lock being held
+        """
+        token = secrets.token_hex(16)
+        if await self.async_redis_client.set(key, token, nx=True, ex=ttl):
+            return token
+        return None
+    
+    async def release_lock(self, key: str, token: str) -> bool:
+        """Release a lock taken with acquire_lock, unless it expired and someone else now holds it"""
+        try:
+            return bool(await self.async_redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, key, token))
+        except Exception as e:
+            logger.error(f"Failed to release lock {key}: {e}")
+            return False
+    
     # User Session Management
     def set_user_online(self, user_id: UUID, ttl: int = 3600) -> bool:
         """Mark user as online"""
@@ -243,17 +335,24 @@ class RedisService:
             'preferences': preferences,
             'timestamp': datetime.utcnow().isoformat()
         }
-        return self.enqueue('matching_queue', queue_item, priority=0)
+        return self.enqueue(MATCHING_QUEUE, queue_item, priority=0)
     
     def remove_from_matching_queue(self, user_id: UUID) -> bool:
         """Remove user from matching queue"""
         try:
-            # Find and remove user from queue
-            queue_items = self.redis_client.zrange('matching_queue', 0, -1, withscores=True)
+            # Indexed entry: remove it directly
+            member = self.redis_client.hget(MATCHING_QUEUE_INDEX, str(user_id))
+            if member:
+                self.redis_client.hdel(MATCHING_QUEUE_INDEX, str(user_id))
+                if self.redis_client.zrem(MATCHING_QUEUE, member):
+                    return True
+            
+            # Entries enqueued before the index existed: find and remove user from queue
+            queue_items = self.redis_client.zrange(MATCHING_QUEUE, 0, -1, withscores=True)
             for item_json, score in queue_items:
                 item = json.loads(item_json)
                 if item.get('user_id') == str(user_id):
-                    return self.redis_client.zrem('matching_queue', item_json)
+                    return self.redis_client.zrem(MATCHING_QUEUE, item_json)
             return False
         except Exception as e:
             logger.error(f"Failed to remove user from matching queue: {e}")
@@ -262,7 +361,18 @@ class RedisService:
     def get_matching_queue_position(self, user_id: UUID) -> int:
         """Get user's position in matching queue"""
         try:
-            queue_items = self.redis_client.zrange('matching_queue', 0, -1)
+            # Indexed entry: a single ZRANK
+            member = self.redis_client.hget(MATCHING_QUEUE_INDEX, str(user_id))
+            if member:
+                rank = self.redis_client.zrank(MATCHING_QUEUE, member)
+                if rank is not None:
+                    return rank + 1
+                # Entry already left the queue - drop the stale index entry
+                self.redis_client.hdel(MATCHING_QUEUE_INDEX, str(user_id))
+                return 0
+            
+            # Entries enqueued before the index existed
+            queue_items = self.redis_client.zrange(MATCHING_QUEUE, 0, -1)
             for i, item_json in enumerate(queue_items):
                 item = json.loads(item_json)
                 if item.get('user_id') == str(user_id):
@@ -274,17 +384,17 @@ class RedisService:
     
     def get_matching_queue_size(self) -> int:
         """Get matching queue size"""
-        return self.get_queue_size('matching_queue')
+        return self.get_queue_size(MATCHING_QUEUE)
     
     def peek_matching_queue(self, count: int = 10) -> List[Dict[str, Any]]:
         """Peek at matching queue"""
-        return self.peek_queue('matching_queue', count)
+        return self.peek_queue(MATCHING_QUEUE, count)
     
     def get_queue_status(self) -> List[Dict[str, Any]]:
         """Get all users currently in the matching queue"""
         try:
             logger.info("🔍 Getting queue status from Redis")
-            queue_items = self.redis_client.zrange('matching_queue', 0, -1, withscores=True)
+            queue_items = self.redis_client.zrange(MATCHING_QUEUE, 0, -1, withscores=True)
             queue_data = []
             
             for item_json, score in queue_items:
@@ -302,10 +412,30 @@ class RedisService:
             logger.error(f"❌ Failed to get queue status: {e}")
             return []
     
+    def _matching_queue_timeout_cutoff(self, timeout_minutes: float) -> float:
+        """
+        Highest queue score that has waited at least timeout_minutes
+        
+        Matching queue entries are enqueued with priority 0, so their score is
+        the enqueue time in seconds (computed the same way as here).
+        """
+        return datetime.utcnow().timestamp() - timeout_minutes * 60
+    
+    def count_users_waiting_too_long(self, timeout_minutes: float = 1) -> int:
+        """Count users who have been waiting in queue for more than timeout_minutes"""
+        try:
+            cutoff = self._matching_queue_timeout_cutoff(timeout_minutes)
+            return self.redis_client.zcount(MATCHING_QUEUE, '-inf', cutoff)
+        except Exception as e:
+            logger.error(f"Failed to count users waiting too long: {e}")
+            return 0
+    
     def get_users_waiting_too_long(self, timeout_minutes: int = 1) -> List[Dict[str, Any]]:
         """Get users who have been waiting in queue for more than timeout_minutes"""
         try:
-            queue_items = self.redis_client.zrange('matching_queue', 0, -1, withscores=True)
+            # Only the score range old enough to have timed out is read and decoded
+            cutoff = self._matching_queue_timeout_cutoff(timeout_minutes)
+            queue_items = self.redis_client.zrangebyscore(MATCHING_QUEUE, '-inf', cutoff, withscores=True)
             timeout_users = []
             current_time = datetime.utcnow()
             
@@ -404,6 +534,21 @@ class MockRedisClient:
     def zcard(self, name: str) -> int:
         return len(self.queues.get(name, []))
     
+    def zrangebyscore(self, name: str, min: Union[float, str], max: Union[float, str], withscores: bool = False) -> List:
+        items = [(item, score) for item, score in self.queues.get(name, []) if float(min) <= score <= float(max)]
+        if withscores:
+            return items
+        return [item for item, score in items]
+    
+    def zcount(self, name: str, min: Union[float, str], max: Union[float, str]) -> int:
+        return len(self.zrangebyscore(name, min, max))
+    
+    def zrank(self, name: str, value: str) -> Optional[int]:
+        for rank, (item, score) in enumerate(self.queues.get(name, [])):
+            if item == value:
+                return rank
+        return None
+    
     def zrem(self, name: str, *values) -> int:
         if name not in self.queues:
             return 0
@@ -422,7 +567,9 @@ class MockRedisClient:
                 count += 1
         return count
     
-    def set(self, name: str, value: Any) -> bool:
+    def set(self, name: str, value: Any, nx: bool = False, ex: Optional[int] = None) -> Optional[bool]:
+        if nx and name in self.data:
+            return None
         self.data[name] = value
         return True
     
@@ -433,9 +580,25 @@ class MockRedisClient:
     def get(self, name: str) -> Optional[Any]:
         return self.data.get(name)
     
+    def incr(self, name: str) -> int:
+        self.data[name] = int(self.data.get(name, 0)) + 1
+        return self.data[name]
+    
     def exists(self, name: str) -> bool:
         return name in self.data
     
+    def hset(self, name: str, key: str, value: Any) -> int:
+        is_new = key not in self.data.setdefault(name, {})
+        self.data[name][key] = value
+        return int(is_new)
+    
+    def hget(self, name: str, key: str) -> Optional[Any]:
+        return self.data.get(name, {}).get(key)
+    
+    def hdel(self, name: str, *keys) -> int:
+        fields = self.data.get(name, {})
+        return sum(1 for key in keys if fields.pop(key, None) is not None)
+    
     def keys(self, pattern: str) -> List[str]:
         if pattern.endswith('*'):
             prefix = pattern[:-1]
@@ -454,4 +617,23 @@ class MockAsyncRedisClient:
         pass
     
     async def ping(self) -> bool:
-        return True 
\ No newline at end of file
+        return True
+    
+    async def get(self, name: str) -> Optional[Any]:
+        return self.sync_client.get(name)
+    
+    async def setex(self, name: str, time: int, value: Any) -> bool:
+        return self.sync_client.setex(name, time, value)
+    
+    async def incr(self, name: str) -> int:
+        return self.sync_client.incr(name)
+    
+    async def set(self, name: str, value: Any, nx: bool = False, ex: Optional[int] = None) -> Optional[bool]:
+        return self.sync_client.set(name, value, nx=nx, ex=ex)
+    
+    async def eval(self, script: str, numkeys: int, *keys_and_args) -> int:
+        # Only _RELEASE_LOCK_SCRIPT is evaluated: delete the key if it holds the token
+        key, token = keys_and_args
+        if self.sync_client.get(key) == token:
+            return self.sync_client.delete(key)
+        return 0 
\ No newline at end of file
@@ -2,8 +2,9 @@
 Matching Repository implementation using Firebase
 """
 
+import heapq
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 
@@ -76,13 +77,21 @@ class MatchingRepository:
             logger.error(f"❌ Failed to find match {match_id}: {e}")
             return None
     
-    def find_matches_by_user_id(self, user_id: UUID, limit: int = 20) -> List[Match]:
+    def find_matches_by_user_id(self, user_id: UUID, limit: int = 20, offset: int = 0, cursor: Optional[Tuple[str, str]] = None) -> List[Match]:
         """
-        Find matches for a user
+        Find matches for a user, newest first
+        
+        Served by the (user_id, created_at DESC) composite index declared in
+        firestore.indexes.json, so each page is an index range read. Matches
+        created at the same instant are ordered by document ID, which Firestore
+        appends to every index, so pages never skip or repeat them.
         
         Args:
             user_id: User's UUID
             limit: Maximum number of matches to return
+            offset: Number of newer matches to skip
+            cursor: (created_at, match ID) of the last match already seen; the page
+                starts right after it, so paging costs O(limit) instead of O(offset + limit)
             
         Returns:
             List of match entities
@@ -94,8 +103,10 @@ class MatchingRepository:
                     {"field": "user_id", "operator": "==", "value": str(user_id)}
                 ],
                 limit=limit,
-                order_by="created_at",
-                order_direction="desc"
+                order_by=["created_at", "__name__"],
+                order_direction="desc",
+                offset=offset,
+                start_after={"created_at": cursor[0], "__name__": cursor[1]} if cursor else None
             )
             
             return [self._dict_to_entity(data) for data in matches_data]
@@ -214,7 +225,7 @@ class MatchingRepository:
                         combined_hashtags = ['#GeneralChat', '#TimeoutMatch']
                     
                     # Create AI session ID for timeout match
-                    ai_session_id = f"timeout_ai_session_{user1_id}_{user2_id}_{datetime.utcnow().timestamp()}"
+                    ai_session_id = f"timeout_ai_session_{uuid4().hex}"
                     
                     # Create full AI match with room and tokens - TIMEOUT VERSION
                     match_data = await self.create_ai_match(
@@ -254,6 +265,32 @@ class MatchingRepository:
             logger.error(f"❌ Failed to process timeout matches: {e}")
             return []
     
+    def _iter_hashtag_candidates(self, hashtags: List[str], exclude_user_id: str = None, min_similarity: float = 0.0) -> Iterator[Tuple[float, str, List[str], set]]:
+        """
+        Yield (similarity, user_id, user_hashtags, overlap) for every queued user
+        that shares at least one hashtag and meets the similarity threshold
+        """
+        wanted = set(hashtags)
+        
+        for user_data in self.redis.get_queue_status():
+            user_id = user_data.get('user_id')
+            if user_id == exclude_user_id:
+                continue
+            
+            # For AI matching, use generated_hashtags directly (not preferred_topics)
+            # Fallback: if no generated_hashtags, try to get from the top-level hashtags
+            user_hashtags = user_data.get('preferences', {}).get('generated_hashtags', []) or user_data.get('hashtags', [])
+            if not user_hashtags:
+                continue
+            
+            overlap = wanted.intersection(user_hashtags)
+            if not overlap:
+                continue
+            
+            similarity = len(overlap) / max(len(hashtags), len(user_hashtags))
+            if similarity >= min_similarity:
+                yield similarity, user_id, user_hashtags, overlap
+    
     def find_users_by_hashtags(self, hashtags: List[str], exclude_user_id: str = None, max_results: int = 10, min_similarity: float = 0.0) -> List[Dict[str, Any]]:
         """
         Find users by hashtags for AI matching
@@ -268,60 +305,26 @@ class MatchingRepository:
             List of matching users with their hashtags and similarity scores
         """
         try:
-            logger.info(f"🔍 Finding users by hashtags: {hashtags}")
-            logger.info(f"🔍 Excluding user: {exclude_user_id}")
-            
-            # Get users from matching queue
-            queue_users = self.redis.get_queue_status()
-            logger.info(f"🔍 Found {len(queue_users)} users in queue")
-            
-            matching_users = []
-            
-            for user_data in queue_users:
-                user_id = user_data.get('user_id')
-                if user_id == exclude_user_id:
-                    logger.info(f"🔍 Skipping excluded user: {user_id}")
-                    continue
-                    
-                user_preferences = user_data.get('preferences', {})
-                
-                # For AI matching, use generated_hashtags directly (not preferred_topics)
-                user_hashtags = user_preferences.get('generated_hashtags', [])
-                
-                # Fallback: if no generated_hashtags, try to get from the top-level hashtags
-                if not user_hashtags:
-                    user_hashtags = user_data.get('hashtags', [])
-                
-                logger.info(f"🔍 User {user_id} hashtags: {user_hashtags}")
-                
-                # Calculate match score based on hashtag overlap
-                if user_hashtags:
-                    overlap = set(hashtags) & set(user_hashtags)
-                    logger.info(f"🔍 Hashtag overlap: {list(overlap)}")
-                    
-                    if overlap:
-                        similarity = len(overlap) / max(len(hashtags), len(user_hashtags))
-                        logger.info(f"🔍 Similarity score: {similarity:.2f} (min required: {min_similarity})")
-                        
-                        if similarity >= min_similarity:
-                            matching_users.append({
-                                'user_id': user_id,
-                                'hashtags': user_hashtags,
-                                'similarity': similarity,
-                                'match_score': similarity,  # For backward compatibility
-                                'overlapping_hashtags': list(overlap)
-                            })
-                            logger.info(f"✅ Added matching user: {user_id} (similarity: {similarity:.2f})")
-                        else:
-                            logger.info(f"❌ User {user_id} similarity too low: {similarity:.2f}")
-                    else:
-                        logger.info(f"❌ No hashtag overlap with user {user_id}")
-                else:
-                    logger.info(f"❌ User {user_id} has no hashtags")
+            logger.info(f"🔍 Finding users by hashtags: {hashtags} (excluding {exclude_user_id})")
+            
+            # Keep only the top-k candidates in a bounded heap instead of
+            # building and sorting a dict for every queued user
+            top_candidates = heapq.nlargest(
+                max_results,
+                self._iter_hashtag_candidates(hashtags, exclude_user_id, min_similarity),
+                key=lambda candidate: candidate[0]
+            )
             
-            # Sort by similarity and return top matches
-            matching_users.sort(key=lambda x: x['similarity'], reverse=True)
-            result = matching_users[:max_results]
+            result = [
+                {
+                    'user_id': user_id,
+                    'hashtags': user_hashtags,
+                    'similarity': similarity,
+                    'match_score': similarity,  # For backward compatibility
+                    'overlapping_hashtags': list(overlap)
+                }
+                for similarity, user_id, user_hashtags, overlap in top_candidates
+            ]
             
             logger.info(f"✅ Found {len(result)} users matching hashtags")
             for user in result:
@@ -332,6 +335,7 @@ class MatchingRepository:
         except Exception as e:
             logger.error(f"❌ Failed to find users by hashtags: {e}")
             return []
+    
 
     def add_to_ai_queue(self, user_id: str, hashtags: List[str] = None, voice_input: str = None, ai_session_id: str = None, ai_analysis: Dict[str, Any] = None):
         """
@@ -407,8 +411,7 @@ class MatchingRepository:
             Number of users waiting too long
         """
         try:
-            timeout_users = self.redis.get_users_waiting_too_long(timeout_minutes)
-            return len(timeout_users)
+            return self.redis.count_users_waiting_too_long(timeout_minutes)
         except Exception as e:
             logger.error(f"❌ Failed to get timeout users count: {e}")
             return 0
@@ -561,7 +564,8 @@ class MatchingRepository:
                 status=MatchStatus.MATCHED,
                 matched_users=[user2_uuid],
                 matched_at=datetime.utcnow(),
-                room_id=saved_room.id
+                room_id=saved_room.id,
+                confidence=confidence
             )
             
             # Save match
@@ -653,7 +657,8 @@ class MatchingRepository:
             "expired_at": match.expired_at.isoformat() if match.expired_at else None,
             "matched_users": [str(u) for u in match.matched_users],
             "selected_topic_id": str(match.selected_topic_id) if match.selected_topic_id else None,
-            "room_id": str(match.room_id) if match.room_id else None
+            "room_id": str(match.room_id) if match.room_id else None,
+            "confidence": match.confidence
         }
     
     def _dict_to_entity(self, data: dict) -> Match:
@@ -670,7 +675,8 @@ class MatchingRepository:
             expired_at=datetime.fromisoformat(data["expired_at"]) if data.get("expired_at") else None,
             matched_users=[UUID(u) for u in data.get("matched_users", [])],
             selected_topic_id=UUID(data["selected_topic_id"]) if data.get("selected_topic_id") else None,
-            room_id=UUID(data["room_id"]) if data.get("room_id") else None
+            room_id=UUID(data["room_id"]) if data.get("room_id") else None,
+            confidence=data.get("confidence", 1.0)
         )
 
 # Helper function to create a new match
@@ -3,10 +3,12 @@ Recording Repository implementation using Firebase
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 
+from google.cloud.firestore import SERVER_TIMESTAMP
+
 from domain.entities import Recording, RecordingStatus, new_recording
 from infrastructure.db.firebase import FirebaseAdminService
 
@@ -49,12 +51,14 @@ class RecordingRepository:
             logger.error(f"❌ Failed to save recording {recording.id}: {e}")
             raise
     
-    def find_by_id(self, recording_id: UUID) -> Optional[Recording]:
+    def find_by_id(self, recording_id: UUID, fields: Optional[Tuple[str, ...]] = None) -> Optional[Recording]:
         """
         Find recording by ID
         
         Args:
             recording_id: Recording's UUID
+            fields: Only fetch these document fields (Firestore field mask);
+                must cover the keys _dict_to_entity requires. None reads the whole document
             
         Returns:
             Recording entity or None if not found
@@ -62,7 +66,8 @@ class RecordingRepository:
         try:
             recording_data = self.firebase.get_document(
                 self.collection_name,
-                str(recording_id)
+                str(recording_id),
+                field_paths=list(fields) if fields else None
             )
             
             if recording_data:
@@ -73,6 +78,60 @@ class RecordingRepository:
             logger.error(f"❌ Failed to find recording {recording_id}: {e}")
             return None
     
+    def find_download_info(self, recording_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Fetch only the fields needed to serve a recording download (Firestore field mask)
+        
+        Args:
+            recording_id: Recording's UUID
+        
+        Returns:
+            Dictionary with status (RecordingStatus), download_url and file_path,
+            or None if the recording is not found
+        """
+        try:
+            recording_data = self.firebase.get_document(
+                self.collection_name,
+                str(recording_id),
+                field_paths=["status", "download_url", "file_path"]
+            )
+            
+            if recording_data is None:
+                return None
+            return {
+                "status": RecordingStatus[recording_data["status"].upper()],
+                "download_url": recording_data.get("download_url"),
+                "file_path": recording_data.get("file_path")
+            }
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to find recording download info {recording_id}: {e}")
+            return None
+    
+    def find_with_transcript(self, recording_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the raw recording document for the transcript endpoint
+        
+        One Firestore read returns everything the transcript flow needs
+        (creator_id, participants, status, download_url, transcript_data)
+        so the route does not re-read the document for the download URL.
+        
+        Args:
+            recording_id: Recording's UUID
+        
+        Returns:
+            Recording document data or None if not found
+        """
+        try:
+            return self.firebase.get_document(
+                self.collection_name,
+                str(recording_id)
+            )
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to find recording {recording_id}: {e}")
+            return None
+    
     def find_by_user_id(self, user_id: UUID, limit: int = 20, offset: int = 0) -> List[Recording]:
         """
         Find recordings by user ID
@@ -93,7 +152,8 @@ class RecordingRepository:
                 ],
                 limit=limit,
                 order_by="created_at",
-                order_direction="desc"
+                order_direction="desc",
+                offset=offset
             )
             
             return [self._dict_to_entity(recording_data) for recording_data in recordings_data]
@@ -102,13 +162,14 @@ class RecordingRepository:
             logger.error(f"❌ Failed to find recordings for user {user_id}: {e}")
             return []
     
-    def find_by_room_id(self, room_id: UUID, limit: int = 20) -> List[Recording]:
+    def find_by_room_id(self, room_id: UUID, limit: int = 20, offset: int = 0) -> List[Recording]:
         """
         Find recordings by room ID
         
         Args:
             room_id: Room's UUID
             limit: Maximum number of recordings to return
+            offset: Number of recordings to skip
             
         Returns:
             List of recording entities
@@ -121,7 +182,8 @@ class RecordingRepository:
                 ],
                 limit=limit,
                 order_by="created_at",
-                order_direction="desc"
+                order_direction="desc",
+                offset=offset
             )
             
             return [self._dict_to_entity(recording_data) for recording_data in recordings_data]
@@ -130,13 +192,14 @@ class RecordingRepository:
             logger.error(f"❌ Failed to find recordings for room {room_id}: {e}")
             return []
     
-    def find_by_topic(self, topic: str, limit: int = 20) -> List[Recording]:
+    def find_by_topic(self, topic: str, limit: int = 20, offset: int = 0) -> List[Recording]:
         """
         Find recordings by topic
         
         Args:
             topic: Topic to filter by
             limit: Maximum number of recordings to return
+            offset: Number of recordings to skip
             
         Returns:
             List of recording entities
@@ -150,7 +213,8 @@ class RecordingRepository:
                 ],
                 limit=limit,
                 order_by="created_at",
-                order_direction="desc"
+                order_direction="desc",
+                offset=offset
             )
             
             return [self._dict_to_entity(recording_data) for recording_data in recordings_data]
@@ -159,6 +223,73 @@ class RecordingRepository:
             logger.error(f"❌ Failed to find recordings by topic {topic}: {e}")
             return []
     
+    def count_by_user_id(self, user_id: UUID) -> int:
+        """
+        Count all recordings a user took part in
+        
+        Args:
+            user_id: User's UUID
+        
+        Returns:
+            Number of recordings (0 if the count fails)
+        """
+        try:
+            return self.firebase.count_documents(
+                self.collection_name,
+                filters=[
+                    {"field": "participants", "operator": "array_contains", "value": str(user_id)}
+                ]
+            )
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to count recordings for user {user_id}: {e}")
+            return 0
+    
+    def count_by_room_id(self, room_id: UUID) -> int:
+        """
+        Count all recordings of a room
+        
+        Args:
+            room_id: Room's UUID
+        
+        Returns:
+            Number of recordings (0 if the count fails)
+        """
+        try:
+            return self.firebase.count_documents(
+                self.collection_name,
+                filters=[
+                    {"field": "room_id", "operator": "==", "value": str(room_id)}
+                ]
+            )
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to count recordings for room {room_id}: {e}")
+            return 0
+    
+    def count_by_topic(self, topic: str) -> int:
+        """
+        Count all ready recordings of a topic
+        
+        Args:
+            topic: Topic to filter by
+        
+        Returns:
+            Number of recordings (0 if the count fails)
+        """
+        try:
+            return self.firebase.count_documents(
+                self.collection_name,
+                filters=[
+                    {"field": "topic", "operator": "==", "value": topic},
+                    {"field": "status", "operator": "==", "value": "ready"}
+                ]
+            )
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to count recordings by topic {topic}: {e}")
+            return 0
+    
     def find_ready_recordings(self, limit: int = 20, offset: int = 0) -> List[Recording]:
         """
         Find all ready recordings
@@ -176,7 +307,8 @@ class RecordingRepository:
                 filters=[{"field": "status", "operator": "==", "value": "ready"}],
                 limit=limit,
                 order_by="created_at",
-                order_direction="desc"
+                order_direction="desc",
+                offset=offset
             )
             
             return [self._dict_to_entity(recording_data) for recording_data in recordings_data]
@@ -199,7 +331,7 @@ class RecordingRepository:
         try:
             update_data = {
                 "status": status.name.lower(),
-                "updated_at": self.firebase.get_server_timestamp()
+                "updated_at": SERVER_TIMESTAMP
             }
             
             self.firebase.update_document(
@@ -215,22 +347,46 @@ class RecordingRepository:
             logger.error(f"❌ Failed to update recording {recording_id}: {e}")
             return False
     
+    def find_metadata(self, recording_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Fetch only a recording's stored metadata map (Firestore field mask)
+        
+        Args:
+            recording_id: Recording's UUID
+        
+        Returns:
+            Metadata dictionary ({} if none stored) or None if the recording is not found
+        """
+        try:
+            recording_data = self.firebase.get_document(
+                self.collection_name,
+                str(recording_id),
+                field_paths=["metadata"]
+            )
+            
+            if recording_data is None:
+                return None
+            return recording_data.get("metadata") or {}
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to find recording metadata {recording_id}: {e}")
+            return None
+    
     def update_recording_metadata(self, recording_id: UUID, metadata: dict) -> bool:
         """
         Update recording metadata
         
         Args:
             recording_id: Recording's UUID
-            metadata: New metadata
+            metadata: Metadata fields to set; other stored metadata fields are kept
             
         Returns:
             True if updated successfully
         """
         try:
-            update_data = {
-                "metadata": metadata,
-                "updated_at": self.firebase.get_server_timestamp()
-            }
+            # Dotted paths update individual fields of the metadata map
+            update_data = {f"metadata.{key}": value for key, value in metadata.items()}
+            update_data["updated_at"] = SERVER_TIMESTAMP
             
             self.firebase.update_document(
                 self.collection_name,
@@ -259,7 +415,7 @@ class RecordingRepository:
         try:
             update_data = {
                 "download_url": download_url,
-                "updated_at": self.firebase.get_server_timestamp()
+                "updated_at": SERVER_TIMESTAMP
             }
             
             self.firebase.update_document(
@@ -275,35 +431,70 @@ class RecordingRepository:
             logger.error(f"❌ Failed to update recording download URL {recording_id}: {e}")
             return False
     
+    def update_transcript(self, recording_id: UUID, transcript_entries: List[Dict[str, Any]]) -> bool:
+        """
+        Store a generated transcript on the recording document
+        
+        Args:
+            recording_id: Recording's UUID
+            transcript_entries: Transcript segments to cache
+        
+        Returns:
+            True if updated successfully
+        """
+        try:
+            update_data = {
+                "transcript_data": transcript_entries,
+                "updated_at": SERVER_TIMESTAMP
+            }
+            
+            self.firebase.update_document(
+                self.collection_name,
+                str(recording_id),
+                update_data
+            )
+            
+            logger.info(f"✅ Recording {recording_id} transcript cached")
+            return True
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to update recording transcript {recording_id}: {e}")
+            return False
+    
     def delete(self, recording_id: UUID) -> bool:
         """
-        Delete recording
+        Delete recording in a single conditional write (no existence pre-read)
         
         Args:
             recording_id: Recording's UUID
             
         Returns:
-            True if deleted successfully
+            True if deleted, False if the recording does not exist
+        
+        Raises:
+            Exception: If the delete fails for any other reason
         """
         try:
-            self.firebase.delete_document(
+            deleted = self.firebase.delete_document(
                 self.collection_name,
-                str(recording_id)
+                str(recording_id),
+                must_exist=True
             )
             
-            logger.info(f"✅ Recording {recording_id} deleted successfully")
-            return True
+            if deleted:
+                logger.info(f"✅ Recording {recording_id} deleted successfully")
+            return deleted
             
         except Exception as e:
             logger.error(f"❌ Failed to delete recording {recording_id}: {e}")
-            return False
+            raise
     
-    def get_download_url(self, recording_id: str, expires_in: int = 3600) -> Optional[str]:
+    def get_download_url(self, recording_id: UUID, expires_in: int = 3600) -> Optional[str]:
         """
         Get download URL for recording file
         
         Args:
-            recording_id: Recording ID
+            recording_id: Recording's UUID
             expires_in: URL expiration time in seconds
             
         Returns:
@@ -315,7 +506,7 @@ class RecordingRepository:
             logger.info(f"🔗 Generating download URL for recording: {recording_id}")
             
             # Check if recording exists
-            recording = self.find_by_id(UUID(recording_id))
+            recording = self.find_by_id(recording_id)
             if not recording:
                 logger.warning(f"⚠️ Recording not found: {recording_id}")
                 return None
@@ -330,18 +521,32 @@ class RecordingRepository:
             logger.error(f"❌ Failed to generate download URL for {recording_id}: {e}")
             return None
 
-    def get_file_metadata(self, recording_id: str) -> Optional[Dict[str, Any]]:
+    def open_file(self, file_path: str, chunk_size: int):
+        """
+        Open a recording file in Firebase Storage for chunked reading
+        
+        Args:
+            file_path: Storage path of the recording file
+            chunk_size: Bytes fetched from Storage per ranged request
+        
+        Returns:
+            Binary file-like reader; the caller closes it
+        """
+        blob = self.firebase.storage_bucket.blob(file_path)
+        return blob.open("rb", chunk_size=chunk_size)
+    
+    def get_file_metadata(self, recording_id: UUID) -> Optional[Dict[str, Any]]:
         """
         Get file metadata for recording
         
         Args:
-            recording_id: Recording ID
+            recording_id: Recording's UUID
             
         Returns:
             File metadata or None if not found
         """
         try:
-            recording = self.find_by_id(UUID(recording_id))
+            recording = self.find_by_id(recording_id)
             if not recording:
                 return None
             
@@ -382,22 +587,33 @@ class RecordingRepository:
             "creator_id": str(recording.creator_id) if recording.creator_id else None
         }
     
+    def _parse_timestamp(self, value: Any) -> Optional[datetime]:
+        """Parse a stored timestamp: server timestamps read back as datetimes, older writes as ISO strings"""
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value) if value else None
+    
     def _dict_to_entity(self, data: dict) -> Recording:
         """Convert dictionary to Recording entity"""
-        return Recording(
+        participant_ids = tuple(data.get("participants", []))
+        recording = Recording(
             id=UUID(data["id"]),
             room_id=UUID(data["room_id"]),
             room_name=data["room_name"],
             topic=data["topic"],
-            participants=[UUID(p) for p in data.get("participants", [])],
+            participants=[UUID(p) for p in participant_ids],
             duration=data.get("duration", 0),
             file_size=data.get("file_size", 0),
             created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
+            updated_at=self._parse_timestamp(data.get("updated_at")),
             status=RecordingStatus[data["status"].upper()],
             download_url=data.get("download_url"),
             metadata=data.get("metadata", {}),
             transcript=data.get("transcript"),
             is_public=data.get("is_public", False),
             creator_id=UUID(data["creator_id"]) if data.get("creator_id") else None
-        ) 
\ No newline at end of file
+        )
+        
+        # Firestore already stores the string IDs; reuse them instead of re-stringifying
+        recording.participant_ids = participant_ids
+        return recording
@@ -2,12 +2,14 @@
 Room Repository implementation using Firebase
 """
 
+import asyncio
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 
 from domain.entities import Room, RoomStatus, new_room
+from domain.exceptions import RoomFullError, RoomNotFoundError
 from infrastructure.db.firebase import FirebaseAdminService
 from infrastructure.livekit.livekit_service import LiveKitService
 
@@ -41,8 +43,9 @@ class RoomRepository:
             
             room_data = self._entity_to_dict(room)
             
-            # Save to Firestore
-            self.firebase.add_document(
+            # Save to Firestore (blocking client, so off the event loop)
+            await asyncio.to_thread(
+                self.firebase.add_document,
                 self.collection_name,
                 room_data,
                 str(room.id)
@@ -55,6 +58,20 @@ class RoomRepository:
             logger.error(f"❌ Failed to save room {room.id}: {e}")
             raise
     
+    async def save_with_token(self, room: Room, user_id: UUID) -> Tuple[Room, str]:
+        """
+        Save a new room and issue a user's LiveKit token for it in one call
+        
+        Args:
+            room: Room entity to save
+            user_id: User's UUID (usually the creator)
+        
+        Returns:
+            Saved room entity and the user's LiveKit access token
+        """
+        saved_room = await self.save(room)
+        return saved_room, self.generate_livekit_token(saved_room.id, user_id)
+    
     def find_by_id(self, room_id: UUID) -> Optional[Room]:
         """
         Find room by ID
@@ -79,6 +96,28 @@ class RoomRepository:
             logger.error(f"❌ Failed to find room {room_id}: {e}")
             return None
     
+    def get_by_id(self, room_id: UUID) -> Room:
+        """
+        Get room by ID
+        
+        Args:
+            room_id: Room's UUID
+        
+        Returns:
+            Room entity
+        
+        Raises:
+            RoomNotFoundError: If the room does not exist
+        """
+        room_data = self.firebase.get_document(
+            self.collection_name,
+            str(room_id)
+        )
+        
+        if not room_data:
+            raise RoomNotFoundError(room_id)
+        return self._dict_to_entity(room_data)
+    
     def find_active_rooms(self, limit: int = 20, offset: int = 0) -> List[Room]:
         """
         Find all active and waiting rooms
@@ -203,6 +242,10 @@ class RoomRepository:
             
         Returns:
             True if added successfully
+        
+        Raises:
+            RoomNotFoundError: If the room does not exist
+            RoomFullError: If the room has no free seat
         """
         try:
             # Get current room data
@@ -213,7 +256,7 @@ class RoomRepository:
             
             if not room_data:
                 logger.error(f"❌ Room {room_id} not found")
-                return False
+                raise RoomNotFoundError(room_id)
             
             participants = room_data.get("participants", [])
             
@@ -226,13 +269,16 @@ class RoomRepository:
             max_participants = room_data.get("max_participants", 10)
             if len(participants) >= max_participants:
                 logger.error(f"❌ Room {room_id} is full")
-                return False
+                raise RoomFullError(room_id)
             
-            # Add participant
+            # Add participant, recording when they joined
             participants.append(str(user_id))
+            joined_at = room_data.get("participant_joined_at") or {}
+            joined_at[str(user_id)] = datetime.now(timezone.utc).isoformat()
             
             update_data = {
                 "participants": participants,
+                "participant_joined_at": joined_at,
                 "updated_at": self.firebase.get_server_timestamp()
             }
             
@@ -245,6 +291,8 @@ class RoomRepository:
             logger.info(f"✅ User {user_id} added to room {room_id}")
             return True
             
+        except (RoomNotFoundError, RoomFullError):
+            raise
         except Exception as e:
             logger.error(f"❌ Failed to add participant to room {room_id}: {e}")
             return False
@@ -276,9 +324,12 @@ class RoomRepository:
             # Remove participant
             if str(user_id) in participants:
                 participants.remove(str(user_id))
+                joined_at = room_data.get("participant_joined_at") or {}
+                joined_at.pop(str(user_id), None)
                 
                 update_data = {
                     "participants": participants,
+                    "participant_joined_at": joined_at,
                     "updated_at": self.firebase.get_server_timestamp()
                 }
                 
@@ -339,6 +390,16 @@ class RoomRepository:
             # Return a mock token for development
             return "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9.mock_token"
     
+    def forget_livekit_token(self, room_id: UUID, user_id: UUID) -> None:
+        """
+        Drop a user's reusable LiveKit token for a room, so a later join gets a fresh one
+        
+        Args:
+            room_id: Room's UUID
+            user_id: User's UUID
+        """
+        self.livekit.forget_room_token(room_id, user_id)
+    
     async def get_room_participants(self, room_id: str) -> List[str]:
         """
         Return the current participant user_id list of the specified room
@@ -348,7 +409,7 @@ class RoomRepository:
         room = self.find_by_id(UUID(room_id))
         if not room:
             return []
-        return [str(uid) for uid in room.current_participants]
+        return list(room.participant_ids)
     
     def find_by_livekit_room_name(self, livekit_name: str) -> Optional[Room]:
         """
@@ -368,7 +429,11 @@ class RoomRepository:
             "id": str(room.id),
             "name": room.name,
             "topic_id": str(room.topic_id),
-            "participants": [str(p) for p in room.current_participants],
+            "topic_name": room.topic_name,
+            "participants": list(room.participant_ids),
+            "participant_joined_at": {
+                str(user_id): joined_at.isoformat() for user_id, joined_at in room.participant_joined_at.items()
+            },
             "max_participants": room.max_participants,
             "status": room.status.name.lower(),
             "created_at": room.created_at.isoformat(),
@@ -384,14 +449,21 @@ class RoomRepository:
     
     def _dict_to_entity(self, data: dict) -> Room:
         """Convert dictionary to Room entity"""
-        return Room(
+        participant_ids = tuple(data.get("participants", []))
+        room = Room(
             id=UUID(data["id"]),
             name=data["name"],
             topic_id=UUID(data["topic_id"]),
-            current_participants=[UUID(p) for p in data.get("participants", [])],
+            topic_name=data.get("topic_name"),
+            current_participants=[UUID(p) for p in participant_ids],
+            participant_joined_at={
+                UUID(user_id): datetime.fromisoformat(joined_at)
+                for user_id, joined_at in (data.get("participant_joined_at") or {}).items()
+            },
             max_participants=data.get("max_participants", 10),
             status=RoomStatus[data["status"].upper()],
             created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=data.get("updated_at"),  # Server timestamp, read back as a datetime
             started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
             ended_at=datetime.fromisoformat(data["ended_at"]) if data.get("ended_at") else None,
             livekit_room_name=data.get("livekit_room_name"),
@@ -400,4 +472,9 @@ class RoomRepository:
             created_by=UUID(data["created_by"]),
             is_recording_enabled=data.get("is_recording_enabled", True),
             recording_id=UUID(data["recording_id"]) if data.get("recording_id") else None
-        ) 
\ No newline at end of file
+        )
+        
+        # Firestore already stores the string forms; reuse them instead of re-formatting
+        room.participant_ids = participant_ids
+        room.created_at_iso = data["created_at"]
+        return room 
\ No newline at end of file
@@ -3,7 +3,7 @@ Topic Repository implementation using Firebase
 """
 
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict
 from uuid import UUID
 
 from domain.entities import Topic, new_topic
@@ -72,6 +72,29 @@ class TopicRepository:
             logger.error(f"❌ Failed to find topic {topic_id}: {e}")
             return None
     
+    def find_by_ids(self, topic_ids: List[UUID]) -> Dict[UUID, Topic]:
+        """
+        Find several topics by ID with a single batched read
+        
+        Args:
+            topic_ids: Topic UUIDs to look up
+        
+        Returns:
+            Dictionary of topic ID -> Topic entity for the topics that exist
+        """
+        try:
+            topics_data = self.firebase.get_documents(
+                self.collection_name,
+                [str(topic_id) for topic_id in topic_ids]
+            )
+            
+            topics = (self._dict_to_entity(topic_data) for topic_data in topics_data.values())
+            return {topic.id: topic for topic in topics}
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to find {len(topic_ids)} topics by ID: {e}")
+            return {}
+    
     def find_all_active(self, limit: int = 50, offset: int = 0) -> List[Topic]:
         """
         Find all active topics
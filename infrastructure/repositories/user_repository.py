@@ -73,6 +73,29 @@ class UserRepository:
             logger.error(f"❌ Failed to find user {user_id}: {e}")
             return None
     
+    def find_by_ids(self, user_ids: List[UUID]) -> Dict[UUID, User]:
+        """
+        Find several users by ID with a single batched read
+        
+        Args:
+            user_ids: User UUIDs to look up
+        
+        Returns:
+            Dictionary of user ID -> User entity for the users that exist
+        """
+        try:
+            users_data = self.firebase.get_documents(
+                self.collection_name,
+                [str(user_id) for user_id in user_ids]
+            )
+            
+            users = (self._dict_to_entity(user_data) for user_data in users_data.values())
+            return {user.id: user for user in users}
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to find {len(user_ids)} users by ID: {e}")
+            return {}
+    
     def find_by_email(self, email: str) -> Optional[User]:
         """
         Find user by email
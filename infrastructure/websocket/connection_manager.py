@@ -2,18 +2,30 @@
 WebSocket Connection Manager
 """
 
-import json
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 import asyncio
 from datetime import datetime
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from infrastructure.redis.redis_service import RedisService
 
 logger = logging.getLogger(__name__)
 
+# Most messages a room connection may have waiting to be written; broadcasts to
+# a connection whose outbox is full are dropped for that connection
+ROOM_OUTBOX_SIZE = 256
+
+# Seconds a closing room connection's writer gets to send what is already queued
+ROOM_OUTBOX_FLUSH_TIMEOUT = 2
+
+
+def encode_message(message: Dict) -> str:
+    """Serialize a message to its JSON text frame (once per message, however many recipients)"""
+    return orjson.dumps(message).decode()
+
 
 class ConnectionManager:
     """
@@ -33,6 +45,9 @@ class ConnectionManager:
         # Background tasks
         self._running_tasks: Set[asyncio.Task] = set()
         
+        # Room connections' outgoing frames: {connection_id: (outbox, writer task)}
+        self._room_outboxes: Dict[str, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        
         logger.info("🔌 WebSocket Connection Manager initialized")
     
     async def connect(self, websocket: WebSocket, user_id: UUID, connection_type: str = "general") -> str:
@@ -118,6 +133,9 @@ class ConnectionManager:
                 logger.error(f"❌ Invalid user_id format in connection metadata: {user_id_str}")
                 user_id = None
             
+            # Send what is already queued for a room connection, then stop its writer
+            await self._close_room_outbox(connection_id)
+            
             # Close WebSocket connection gracefully if still open
             if user_id_str in self.active_connections and connection_id in self.active_connections[user_id_str]:
                 websocket = self.active_connections[user_id_str][connection_id]
@@ -150,6 +168,9 @@ class ConnectionManager:
             # Force cleanup even on error
             try:
                 self.connection_metadata.pop(connection_id, None)
+                room_outbox = self._room_outboxes.pop(connection_id, None)
+                if room_outbox:
+                    room_outbox[1].cancel()
                 # Try to remove from active connections
                 for user_connections in self.active_connections.values():
                     user_connections.pop(connection_id, None)
@@ -175,10 +196,16 @@ class ConnectionManager:
         
         sent_count = 0
         connections_to_remove = []
+        frame = encode_message(message)
         
         for connection_id, websocket in self.active_connections[user_id_str].items():
             try:
-                await websocket.send_text(json.dumps(message))
+                # Room connections are only ever written by their outbox writer
+                if connection_id in self._room_outboxes:
+                    if not self._queue_room_frame(connection_id, frame, message):
+                        continue
+                else:
+                    await websocket.send_text(frame)
                 sent_count += 1
                 
                 # Update last ping
@@ -213,15 +240,16 @@ class ConnectionManager:
         """
         sent_count = 0
         exclude_user_str = str(exclude_user_id) if exclude_user_id else None
+        frame = encode_message(message)
         
-        for connection_id, metadata in self.connection_metadata.items():
+        for connection_id, metadata in list(self.connection_metadata.items()):
             if metadata["connection_type"] != connection_type:
                 continue
                 
             if exclude_user_str and metadata["user_id"] == exclude_user_str:
                 continue
             
-            if await self._send_to_connection(connection_id, message):
+            if await self._send_to_connection(connection_id, message, frame):
                 sent_count += 1
         
         logger.debug(f"📡 Broadcasted to {sent_count} {connection_type} connections")
@@ -264,13 +292,14 @@ class ConnectionManager:
             stats[conn_type] = stats.get(conn_type, 0) + 1
         return stats
     
-    async def _send_to_connection(self, connection_id: str, message: Dict) -> bool:
+    async def _send_to_connection(self, connection_id: str, message: Dict, frame: Optional[str] = None) -> bool:
         """
         Send message to a specific connection with improved error handling
         
         Args:
             connection_id: Connection ID
             message: Message to send
+            frame: The message already encoded by encode_message (broadcasts encode it once)
             
         Returns:
             True if sent successfully
@@ -293,8 +322,11 @@ class ConnectionManager:
         websocket = self.active_connections[user_id_str][connection_id]
         message_type = message.get("type", "unknown")
         
+        if connection_id in self._room_outboxes:
+            return self._queue_room_frame(connection_id, frame if frame is not None else encode_message(message), message)
+        
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(frame if frame is not None else encode_message(message))
             
             # Only log non-ping messages to reduce noise
             if message_type != "ping":
@@ -394,6 +426,7 @@ class ConnectionManager:
         # Clear data structures
         self.active_connections.clear()
         self.connection_metadata.clear()
+        self._room_outboxes.clear()
         
         logger.info("✅ WebSocket Connection Manager cleanup complete") 
     
@@ -428,6 +461,15 @@ class ConnectionManager:
                 "connected_at": datetime.utcnow().isoformat()
             }
             
+            # One writer task per connection drains its outbox, so a slow client
+            # never holds up broadcasts to the rest of the room
+            outbox = asyncio.Queue(maxsize=ROOM_OUTBOX_SIZE)
+            writer = asyncio.create_task(self._write_room_outbox(connection_id, websocket, outbox))
+            self._running_tasks.add(writer)
+            writer.add_done_callback(self._running_tasks.discard)
+            self._room_outboxes[connection_id] = (outbox, writer)
+            websocket.state.room_connection_id = connection_id
+            
             # Update Redis state
             self.redis.set_user_online(user_id)
             
@@ -453,7 +495,8 @@ class ConnectionManager:
             # Find and remove the connection
             for user_id, connections in self.active_connections.items():
                 if connection_id in connections:
-                    # Close the WebSocket
+                    # Send what is already queued, then close the WebSocket
+                    await self._close_room_outbox(connection_id)
                     websocket = connections[connection_id]
                     try:
                         await websocket.close()
@@ -496,14 +539,15 @@ class ConnectionManager:
         sent_count = 0
         
         try:
-            # Find all connections for this room
+            # Encode once and queue the same frame on each room connection's outbox;
+            # their writer tasks send it
+            frame = encode_message(message)
             for connection_id, metadata in self.connection_metadata.items():
                 if (metadata.get("connection_type") == "room" and 
                     metadata.get("room_name") == room_name and
                     connection_id != exclude_connection_id):
                     
-                    success = await self._send_to_connection(connection_id, message)
-                    if success:
+                    if connection_id in self._room_outboxes and self._queue_room_frame(connection_id, frame, message):
                         sent_count += 1
             
             logger.info(f"📡 Broadcasted to room {room_name}: {sent_count} recipients")
@@ -513,6 +557,77 @@ class ConnectionManager:
             logger.error(f"❌ Failed to broadcast to room {room_name}: {e}")
             return sent_count
     
+    async def _write_room_outbox(self, connection_id: str, websocket: WebSocket, outbox: asyncio.Queue) -> None:
+        """
+        Send a room connection's queued messages in order until it is closed
+        
+        Args:
+            connection_id: Connection ID the outbox belongs to
+            websocket: WebSocket connection
+            outbox: Queue of encoded frames to send; None marks the end
+        """
+        try:
+            while True:
+                frame = await outbox.get()
+                if frame is None:
+                    break
+                await websocket.send_text(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # The client is gone: stop accepting messages for it
+            logger.debug(f"📤 Room writer stopped for {connection_id}: {e}")
+            self._room_outboxes.pop(connection_id, None)
+            # Wake senders waiting for room in the outbox; nothing will send their frames
+            while not outbox.empty():
+                outbox.get_nowait()
+    
+    def _queue_room_frame(self, connection_id: str, frame: str, message: Dict) -> bool:
+        """Queue a frame on a room connection's outbox; False if the outbox is full and the frame was dropped"""
+        try:
+            self._room_outboxes[connection_id][0].put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"⚠️ Outbox full for {connection_id}, dropping {message.get('type', 'unknown')} message")
+            return False
+    
+    async def send_to_websocket(self, websocket: WebSocket, message: Dict) -> None:
+        """
+        Send a message on a WebSocket, through its room outbox once it has joined a room
+        
+        A room connection's socket is only written by its outbox writer, so
+        replies to the client never interleave with broadcasts or overtake them.
+        Unlike broadcasts, a reply waits for room in the outbox instead of being dropped.
+        
+        Args:
+            websocket: WebSocket connection
+            message: Message to send
+        """
+        frame = encode_message(message)
+        room_outbox = self._room_outboxes.get(getattr(websocket.state, "room_connection_id", None))
+        if room_outbox:
+            await room_outbox[0].put(frame)
+        else:
+            await websocket.send_text(frame)
+    
+    async def _close_room_outbox(self, connection_id: str) -> None:
+        """Let a room connection's writer send what is already queued, then stop it and drop its outbox"""
+        room_outbox = self._room_outboxes.pop(connection_id, None)
+        if not room_outbox:
+            return
+        
+        outbox, writer = room_outbox
+        if outbox.full():
+            # No room for the end marker; the backlog is dropped
+            writer.cancel()
+            return
+        
+        outbox.put_nowait(None)
+        try:
+            await asyncio.wait_for(writer, ROOM_OUTBOX_FLUSH_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug(f"📤 Room writer for {connection_id} did not flush in time, stopped it")
+    
     async def get_room_participants(self, room_name: str) -> List[str]:
         """
         Get list of user IDs currently in a room
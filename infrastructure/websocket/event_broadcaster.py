@@ -96,7 +96,7 @@ class EventBroadcaster:
         
         logger.info(f"📢 Match found broadcast sent to {len(user_ids)} users")
     
-    async def broadcast_queue_update(self, user_id: UUID, position: int, estimated_wait_time: int) -> None:
+    async def broadcast_queue_update(self, user_id: UUID, position: int, estimated_wait_time: int, queue_size: Optional[int] = None) -> bool:
         """
         Broadcast queue position update to a user
         
@@ -104,17 +104,25 @@ class EventBroadcaster:
             user_id: User's ID
             position: Current position in queue
             estimated_wait_time: Estimated wait time in seconds
+            queue_size: Current queue size, read from Redis if not given
+        
+        Returns:
+            True if the update reached at least one of the user's connections
         """
+        if queue_size is None:
+            queue_size = self.redis.get_matching_queue_size()
+        
         message = {
             "type": "queue_update",
             "position": position,
             "estimated_wait_time": estimated_wait_time,
-            "queue_size": self.redis.get_matching_queue_size(),
+            "queue_size": queue_size,
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        await self.connection_manager.send_to_user(user_id, message)
+        sent = await self.connection_manager.send_to_user(user_id, message)
         logger.debug(f"📊 Queue update sent to user {user_id}: position={position}")
+        return sent
     
     async def broadcast_user_status_change(self, user_id: UUID, is_online: bool) -> None:
         """
@@ -320,6 +328,7 @@ class EventBroadcaster:
             logger.info("🔍 Starting matching queue monitoring")
             
             last_queue_size = 0  # Track queue size changes
+            last_positions: Dict[str, int] = {}  # Last position pushed to each queued user
             
             while self._is_running:
                 try:
@@ -342,13 +351,30 @@ class EventBroadcaster:
                         
                         last_queue_size = current_queue_size
                     
-                    # Send position updates to users in queue
+                    # Push position updates only to users whose position changed since the last
+                    # delivered update, so a waiting user hears about each move once instead of
+                    # every tick (users not connected yet are retried on the next check)
+                    positions: Dict[str, int] = {}
                     for position, item in enumerate(queue_items, 1):
                         if isinstance(item, dict) and 'user_id' in item:
-                            user_id = UUID(item['user_id'])
+                            positions.setdefault(item['user_id'], position)
+                    
+                    moved = [
+                        (user_id_str, position) for user_id_str, position in positions.items()
+                        if last_positions.get(user_id_str) != position
+                    ]
+                    delivered = {
+                        user_id_str: position for user_id_str, position in positions.items()
+                        if last_positions.get(user_id_str) == position
+                    }
+                    if moved:
+                        queue_size = self.redis.get_matching_queue_size()
+                        for user_id_str, position in moved:
                             estimated_wait = position * 30  # 30 seconds per position
-                            
-                            await self.broadcast_queue_update(user_id, position, estimated_wait)
+                            if await self.broadcast_queue_update(UUID(user_id_str), position, estimated_wait, queue_size=queue_size):
+                                delivered[user_id_str] = position
+                    
+                    last_positions = delivered
                     
                     # Check for potential matches (simplified logic)
                     await self._check_for_matches(queue_items)
@@ -513,6 +539,7 @@ class EventBroadcaster:
                 
             # Group users by hashtag similarity
             processed_users = set()
+            pairs = []
             
             for i, user1 in enumerate(connected_users):
                 user1_id = user1.get('user_id')
@@ -562,18 +589,30 @@ class EventBroadcaster:
                         best_similarity = similarity
                         best_match = user2
                         logger.info(f"🎯 [MATCHING] Similarity {user1_id[:8]}...↔{user2_id[:8]}...: {similarity:.2f} (shared: {intersection})")
+                        
+                        # Identical hashtag sets - no later candidate can beat this
+                        if similarity >= 1.0:
+                            break
 
                 # Create match if good similarity found (using flexible threshold)
                 min_threshold = 0.05 if best_similarity > 0 else 0.0  # 5% if they share hashtags, 0% if desperate
                 if best_match and best_similarity >= min_threshold:
                     logger.info(f"🎉 [MATCHING] CREATING MATCH: {user1['user_id'][:8]}... + {best_match['user_id'][:8]}... (similarity: {best_similarity:.2f})")
-                    await self._create_ai_match_with_room(user1, best_match, best_similarity)
+                    pairs.append((user1, best_match, best_similarity))
                     processed_users.add(user1.get('user_id'))
                     processed_users.add(best_match.get('user_id'))
                 else:
                     # No suitable match found - user will continue waiting
                     logger.info(f"🔍 [MATCHING] No suitable match found for {user1['user_id'][:8]}... (best similarity: {best_similarity:.2f})")
                     logger.info(f"   User will continue waiting for better match or timeout matching")
+            
+            # Room setup and agent deployment for each pair is independent I/O, so
+            # create the matches concurrently instead of one pair after another
+            if pairs:
+                await asyncio.gather(*(
+                    self._create_ai_match_with_room(user1, user2, similarity)
+                    for user1, user2, similarity in pairs
+                ))
                         
         except Exception as e:
             logger.error(f"❌ Error in AI hashtag matching: {e}")
@@ -663,7 +702,7 @@ class EventBroadcaster:
             logger.info(f"   📊 Similarity: {similarity:.2f}")
             
             # Create AI session ID
-            ai_session_id = f"bg_ai_session_{user1_id_str}_{user2_id_str}_{datetime.utcnow().timestamp()}"
+            ai_session_id = f"bg_ai_session_{uuid4().hex}"
             
             # Use the repository to create a full match with room and tokens
             matching_repo = container.get_matching_repository()
@@ -693,12 +732,12 @@ class EventBroadcaster:
         try:
             logger.info("🕐 Starting timeout matching monitor")
             
+            # Import here to avoid circular imports (once, not on every round)
+            from infrastructure.container import container
+            matching_repo = container.get_matching_repository()
+            
             while self._is_running:
                 try:
-                    # Import here to avoid circular imports
-                    from infrastructure.container import container
-                    matching_repo = container.get_matching_repository()
-                    
                     # Check for users waiting over 1 minute
                     timeout_users_count = matching_repo.get_timeout_users_count(timeout_minutes=1)
                     
@@ -0,0 +1,56 @@
+"""
+WebSocket payload schemas
+
+Fixed-shape messages sent on the matching WebSocket endpoints. Each schema is a
+msgspec.Struct so a single shared encoder can serialize it straight to JSON
+bytes without building and hashing an intermediate dict.
+
+Inbound client messages are only inspected for their "type", so they are
+decoded into a one-field struct and every other key is skipped unparsed.
+"""
+
+from datetime import datetime
+
+import msgspec
+
+
+class Welcome(msgspec.Struct, kw_only=True):
+    """Greeting sent once the connection is registered"""
+    type: str = "welcome"
+    message: str
+    user_id: str
+    connection_id: str
+    timestamp: str
+
+
+class Authenticated(msgspec.Struct, kw_only=True):
+    """Acknowledgement of a client auth message"""
+    type: str = "authenticated"
+    user_id: str
+    timestamp: str
+
+
+class Pong(msgspec.Struct, kw_only=True):
+    """Reply to a client heartbeat ping"""
+    type: str = "pong"
+    timestamp: str
+
+
+class InboundMessage(msgspec.Struct):
+    """Client message, reduced to the field the endpoints dispatch on"""
+    type: str = "unknown"
+
+
+_ENCODER = msgspec.json.Encoder()
+_INBOUND_DECODER = msgspec.json.Decoder(InboundMessage)
+
+# Serialize a payload struct to UTF-8 JSON bytes
+encode_payload = _ENCODER.encode
+
+# Parse a client text frame; raises msgspec.DecodeError on malformed input
+decode_inbound = _INBOUND_DECODER.decode
+
+
+def iso_now() -> str:
+    """Current UTC time in ISO format, matching the other WebSocket timestamps"""
+    return datetime.utcnow().isoformat()
@@ -12,7 +12,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 
@@ -23,6 +23,7 @@ load_dotenv()
 from api.routers import auth, topics, matching, rooms, friends, recordings
 from infrastructure.container import container
 from infrastructure.config import Settings
+from domain.exceptions import RoomFullError, RoomNotFoundError
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +53,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         container.initialize()
         logger.info("📦 Container initialized successfully")
         
+        # Shared repositories resolved once, read by request dependencies from app.state
+        app.state.topic_repo = container.get_topic_repository()
+        
         # Initialize Redis connection
         redis_service = container.get_redis_service()
         redis_healthy = redis_service.health_check()
@@ -85,7 +89,8 @@ app = FastAPI(
     title="VoiceApp API",
     description="AI-driven voice social platform backend API",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -113,11 +118,27 @@ except Exception as e:
     # If your runtime is read-only, fall back gracefully
     logger.warning(f"⚠️ Could not mount static dir '{static_dir}': {e}. Static route disabled.")
 
+# Domain exception handlers: endpoints let these propagate instead of
+# translating them to HTTPException themselves
+@app.exception_handler(RoomNotFoundError)
+async def room_not_found_handler(request: Request, exc: RoomNotFoundError):
+    return ORJSONResponse(
+        status_code=404,
+        content={"detail": str(exc)}
+    )
+
+@app.exception_handler(RoomFullError)
+async def room_full_handler(request: Request, exc: RoomFullError):
+    return ORJSONResponse(
+        status_code=400,
+        content={"detail": str(exc)}
+    )
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"Global exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -150,5 +171,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.PORT,
         reload=settings.DEBUG,
-        log_level="info"
+        log_level="info",
+        ws_ping_interval=20,
+        ws_ping_timeout=20
     ) 
\ No newline at end of file
@@ -40,12 +40,11 @@ class ManageTopicPreferencesUseCase:
                 logger.warning(f"⚠️ User not found: {user_id}")
                 return []
             
-            # Get full topic objects for user's interests
-            preferred_topics = []
-            for topic_id in user.interests:
-                topic = self.topic_repository.find_by_id(UUID(topic_id))
-                if topic:
-                    preferred_topics.append(topic)
+            # Get full topic objects for user's interests with one batched read,
+            # keeping the user's order
+            interest_ids = [UUID(topic_id) for topic_id in user.interests]
+            topics = self.topic_repository.find_by_ids(interest_ids)
+            preferred_topics = [topics[topic_id] for topic_id in interest_ids if topic_id in topics]
             
             logger.info(f"✅ Retrieved {len(preferred_topics)} topic preferences")
             return preferred_topics
@@ -73,10 +72,11 @@ class ManageTopicPreferencesUseCase:
                 logger.warning(f"⚠️ User not found: {user_id}")
                 return False
             
-            # Validate that all topics exist
+            # Validate that all topics exist (one batched read)
+            topics = self.topic_repository.find_by_ids(topic_ids)
             valid_topic_ids = []
             for topic_id in topic_ids:
-                topic = self.topic_repository.find_by_id(topic_id)
+                topic = topics.get(topic_id)
                 if topic and topic.is_active:
                     valid_topic_ids.append(str(topic_id))
                 else: